@@ -2,4 +2,7 @@
 
 from any2md.cli import main
 
-main()
+# Guarded so --jobs worker processes (spawn start method) can re-import
+# this module without re-entering the CLI.
+if __name__ == "__main__":
+    main()
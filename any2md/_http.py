@@ -11,15 +11,19 @@ defends against:
 
 from __future__ import annotations
 
+import http.client
 import ipaddress
 import socket
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections.abc import Callable
+from typing import Any
 
 _MAX_REDIRECT_HOPS = 3
 _FETCH_TIMEOUT = 15  # seconds
 _MAX_RESPONSE_BYTES = 20 * 1024 * 1024  # 20 MB cap on body read
+_STREAM_CHUNK_BYTES = 64 * 1024  # safe_stream read size
 _USER_AGENT = "any2md/1.0.6"
 
 
@@ -27,17 +31,47 @@ def validate_url(url: str) -> str | None:
     """Validate URL scheme + host. Returns an error message or None.
 
     One-shot DNS lookup; rebind protection requires re-checking on
-    every redirect hop (handled by ``safe_fetch``).
+    every redirect hop (handled by ``safe_fetch``). The host verdict is
+    memoised per hostname by ``_check_host``.
     """
     parsed = urllib.parse.urlparse(url)
     if parsed.scheme not in ("http", "https"):
         return f"unsupported scheme: {parsed.scheme!r}"
     if not parsed.hostname:
         return f"no hostname in URL: {url}"
+    return _check_host(parsed.hostname)
+
+
+# Hostnames that passed ``_check_host``. Only passes are remembered, so a
+# transient DNS failure doesn't block a host for the rest of the process.
+_SAFE_HOSTS: set[str] = set()
+_SAFE_HOSTS_MAX = 1024
+
+
+def _check_host(hostname: str) -> str | None:
+    """Resolve ``hostname`` and reject private/reserved addresses.
+
+    Hosts that pass are remembered for the life of the process: a batch
+    of URLs on one site (and the Last-Modified HEAD that follows each
+    fetch) resolves the host once instead of once per request. A CLI run
+    is far shorter than any DNS TTL this check cares about. Failures are
+    re-checked on every call.
+    """
+    if hostname in _SAFE_HOSTS:
+        return None
+    err = _resolve_and_check(hostname)
+    if err is None:
+        if len(_SAFE_HOSTS) >= _SAFE_HOSTS_MAX:
+            _SAFE_HOSTS.clear()
+        _SAFE_HOSTS.add(hostname)
+    return err
+
+
+def _resolve_and_check(hostname: str) -> str | None:
     try:
-        infos = socket.getaddrinfo(parsed.hostname, None, type=socket.SOCK_STREAM)
+        infos = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
     except socket.gaierror:
-        return f"cannot resolve host: {parsed.hostname}"
+        return f"cannot resolve host: {hostname}"
     for *_, sockaddr in infos:
         try:
             addr = ipaddress.ip_address(sockaddr[0])
@@ -60,47 +94,96 @@ class _NoFollowRedirect(urllib.request.HTTPRedirectHandler):
         return None
 
 
-def safe_fetch(
-    url: str,
-    *,
-    method: str = "GET",
-    max_hops: int = _MAX_REDIRECT_HOPS,
-) -> tuple[bytes | None, dict | None, str | None]:
-    """Fetch ``url`` with manual redirect walking + per-hop revalidation.
+def _open_validated(
+    url: str, method: str, max_hops: int
+) -> tuple[Any | None, str | None]:
+    """Open ``url``, walking redirects manually with per-hop revalidation.
 
-    Returns ``(body, headers, None)`` on 2xx, or ``(None, None, error)``
-    on rejection / failure. ``headers`` is the response headers as a
-    plain ``dict``.
+    Returns ``(response, None)`` on 2xx, or ``(None, error)`` on
+    rejection / failure. The caller owns reading the body.
     """
     visited: list[str] = []
     current = url
     opener = urllib.request.build_opener(_NoFollowRedirect())
     for hop in range(max_hops + 1):
         if current in visited:
-            return None, None, "redirect loop"
+            return None, "redirect loop"
         visited.append(current)
         err = validate_url(current)
         if err:
-            return None, None, err
+            return None, err
         req = urllib.request.Request(
             current, method=method, headers={"User-Agent": _USER_AGENT}
         )
         try:
-            resp = opener.open(req, timeout=_FETCH_TIMEOUT)
+            return opener.open(req, timeout=_FETCH_TIMEOUT), None
         except urllib.error.HTTPError as e:
             if e.code in (301, 302, 303, 307, 308):
                 if hop >= max_hops:
-                    return None, None, f"too many redirects (>{max_hops})"
+                    return None, f"too many redirects (>{max_hops})"
                 location = e.headers.get("Location") if e.headers else None
                 if not location:
-                    return None, None, f"HTTP {e.code} without Location"
+                    return None, f"HTTP {e.code} without Location"
                 current = urllib.parse.urljoin(current, location)
                 continue
-            return None, None, f"HTTP {e.code}"
+            return None, f"HTTP {e.code}"
         except (urllib.error.URLError, OSError, TimeoutError) as e:
+            return None, f"fetch error: {e}"
+    return None, f"too many redirects (>{max_hops})"
+
+
+def safe_fetch(
+    url: str,
+    *,
+    method: str = "GET",
+    max_hops: int = _MAX_REDIRECT_HOPS,
+) -> tuple[bytes | None, dict | None, str | None]:
+    """Fetch ``url`` with manual redirect walking + per-hop revalidation.
+
+    Returns ``(body, headers, None)`` on 2xx, or ``(None, None, error)``
+    on rejection / failure. ``headers`` is the response headers as a
+    plain ``dict``.
+    """
+    resp, err = _open_validated(url, method, max_hops)
+    if err:
+        return None, None, err
+    with resp:
+        try:
+            body = resp.read(_MAX_RESPONSE_BYTES + 1)
+        except (http.client.HTTPException, OSError, TimeoutError) as e:
             return None, None, f"fetch error: {e}"
-        body = resp.read(_MAX_RESPONSE_BYTES + 1)
         if len(body) > _MAX_RESPONSE_BYTES:
             return None, None, f"response exceeds {_MAX_RESPONSE_BYTES} bytes"
         return body, dict(resp.headers), None
-    return None, None, f"too many redirects (>{max_hops})"
+
+
+def safe_stream(
+    url: str,
+    on_chunk: Callable[[bytes], None],
+    *,
+    chunk_size: int = _STREAM_CHUNK_BYTES,
+    max_hops: int = _MAX_REDIRECT_HOPS,
+) -> tuple[dict | None, str | None]:
+    """GET ``url`` like ``safe_fetch`` but hand the body over in chunks.
+
+    ``on_chunk`` is called with each ``chunk_size`` read as it arrives,
+    so the caller can parse while the download is still in flight and
+    the full body is never buffered here. The same response-size cap
+    applies; when it trips, ``on_chunk`` has already seen a prefix of
+    the body and the caller must discard it. Returns ``(headers, None)``
+    on success or ``(None, error)``.
+    """
+    resp, err = _open_validated(url, "GET", max_hops)
+    if err:
+        return None, err
+    total = 0
+    with resp:
+        try:
+            while chunk := resp.read(chunk_size):
+                total += len(chunk)
+                if total > _MAX_RESPONSE_BYTES:
+                    return None, f"response exceeds {_MAX_RESPONSE_BYTES} bytes"
+                on_chunk(chunk)
+        except (http.client.HTTPException, OSError, TimeoutError) as e:
+            return None, f"fetch error: {e}"
+        return dict(resp.headers), None
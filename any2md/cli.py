@@ -1,8 +1,16 @@
 """CLI entry point for any2md."""
 
 import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import stat
 import sys
+import tempfile
 import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
@@ -14,12 +22,13 @@ from any2md.config import (
 )
 from any2md.converters import (
     SUPPORTED_EXTENSIONS,
+    add_warnings,
     collected_warnings,
     convert_file,
     reset_warnings,
     set_output_mode,
+    set_page_workers,
 )
-from any2md.converters.html import convert_url
 from any2md.frontmatter import filter_reserved_overrides
 from any2md.pipeline import PipelineOptions
 from any2md.utils import sanitize_filename, url_to_filename
@@ -28,6 +37,71 @@ from any2md.utils import sanitize_filename, url_to_filename
 _DEFAULT_MAX_FILE_SIZE = 100 * 1024 * 1024
 
 
+def _stat_size(stat_fn: Callable[[], os.stat_result]) -> int | None:
+    try:
+        return stat_fn().st_size
+    except OSError:
+        return None
+
+
+def _folds_case(directory: Path) -> bool:
+    """Whether the filesystem holding ``directory`` ignores filename case.
+
+    Probes with a throwaway temp file in ``directory`` (or its nearest
+    existing ancestor, if it isn't created yet). If the probe can't be
+    made, answers ``True`` — treating names as clashing only ever skips.
+    """
+    probe_dir = directory
+    while not probe_dir.is_dir() and probe_dir != probe_dir.parent:
+        probe_dir = probe_dir.parent
+    try:
+        with tempfile.NamedTemporaryFile(prefix=".any2md-case-", dir=probe_dir) as f:
+            head, name = os.path.split(f.name)
+            return os.path.exists(os.path.join(head, name.upper()))
+    except OSError:
+        return True
+
+
+def _scan_dir(directory: Path, recursive: bool) -> list[tuple[Path, int | None]]:
+    """Return ``(path, size)`` for the supported input files in ``directory``.
+
+    Sorted by path. Each directory is read with one ``os.scandir`` pass
+    filtered on the lowercased suffix — not one glob (or, with
+    ``recursive``, one full tree walk) per extension — and only matches
+    become ``Path`` objects. ``DirEntry.is_file()`` answers from the
+    cached ``d_type`` for regular entries and still follows symlinks, as
+    glob did. Like rglob, the recursive walk does not descend into
+    symlinked directories (so a ``loop -> ..`` link can't recurse
+    forever or list a tree twice), and entries or subdirectories that
+    can't be read are skipped. The size comes from ``DirEntry.stat()``
+    (free on Windows, one cached call elsewhere) so ``main`` doesn't stat
+    the input again; it is ``None`` if that stat failed.
+    """
+    found: list[tuple[Path, int | None]] = []
+    pending = [os.fspath(directory)]
+    while pending:
+        try:
+            it = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if not (
+                        os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                        and entry.is_file()
+                    ):
+                        continue
+                except OSError:
+                    continue
+                found.append((Path(entry.path), _stat_size(entry.stat)))
+    found.sort(key=lambda item: item[0])
+    return found
+
+
 def parse_meta_args(meta_args: list[str]) -> dict[str, Any]:
     """Parse repeated ``--meta KEY=VAL`` arguments into a nested dict.
 
@@ -73,6 +147,107 @@ def _deep_merge_overrides(
     return out
 
 
+def _init_worker(quiet: bool, verbose: bool) -> None:
+    """Process-pool initializer: mirror the parent's CLI output mode."""
+    set_output_mode(quiet=quiet, verbose=verbose)
+
+
+def _convert_in_worker(
+    target: Path | str,
+    output_dir: Path,
+    options: PipelineOptions,
+    force: bool,
+) -> tuple[bool, list[str], str, str]:
+    """Convert one input inside a pool worker, capturing its console output.
+
+    ``target`` is a local file ``Path`` or a URL, which the worker fetches
+    and parses through ``convert_url`` exactly as the serial loop does.
+    Returns ``(ok, warnings, stdout, stderr)`` so the parent can replay
+    per-file status lines in submission order and fold the worker's
+    pipeline warnings into its own run-level bucket (module globals
+    don't cross the process boundary).
+    """
+    reset_warnings()
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        if isinstance(target, Path):
+            ok = convert_file(
+                target,
+                output_dir,
+                options=options,
+                force=force,
+                skip_existence_check=True,
+            )
+        else:
+            from any2md.converters.html import convert_url
+
+            ok = convert_url(
+                target,
+                output_dir,
+                options=options,
+                force=force,
+                skip_existence_check=True,
+            )
+    return ok, collected_warnings(), out.getvalue(), err.getvalue()
+
+
+def _convert_parallel(
+    urls: list[str],
+    file_paths: list[Path],
+    output_dir: Path,
+    options: PipelineOptions,
+    force: bool,
+    jobs: int,
+    quiet: bool,
+    verbose: bool,
+) -> tuple[int, int]:
+    """Convert ``urls`` and ``file_paths`` on a pool of worker processes.
+
+    Every input is submitted to the pool up front; a URL's worker
+    downloads and parses it while other workers convert. Per-task output
+    is buffered and replayed in submission order — URLs first, then
+    files, matching the serial loop — as soon as every earlier task has
+    finished, so progress shows while the batch is still running.
+    Returns ``(ok, fail)``.
+    """
+    results: dict[int, tuple[bool, list[str], str, str]] = {}
+    ok = 0
+    fail = 0
+    next_index = 0
+
+    def _replay_ready() -> None:
+        nonlocal ok, fail, next_index
+        while next_index in results:
+            success, warnings, out, err = results.pop(next_index)
+            next_index += 1
+            sys.stdout.write(out)
+            sys.stderr.write(err)
+            add_warnings(warnings)
+            if success:
+                ok += 1
+            else:
+                fail += 1
+        sys.stdout.flush()
+
+    # spawn, matching the PDF page-range pool: no inherited lock state.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(quiet, verbose),
+    ) as pool:
+        targets: list[Path | str] = [*urls, *file_paths]
+        futures = {
+            pool.submit(_convert_in_worker, target, output_dir, options, force): i
+            for i, target in enumerate(targets)
+        }
+        for fut in as_completed(futures):
+            results[futures[fut]] = fut.result()
+            _replay_ready()
+    return ok, fail
+
+
 def main():
     script_dir = Path.cwd()
     default_output_dir = script_dir / "Text"
@@ -123,6 +298,15 @@ def main():
         default=_DEFAULT_MAX_FILE_SIZE,
         help=f"Maximum file size in bytes (default: {_DEFAULT_MAX_FILE_SIZE}).",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Convert up to N inputs in parallel worker processes "
+        "(default: 1, serial). Pass 0 to use one worker per CPU.",
+    )
     parser.add_argument(
         "--high-fidelity",
         "-H",
@@ -222,6 +406,8 @@ def main():
         ".any2md.toml is auto-discovered by walking up from cwd.",
     )
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
 
     # Resolution order: discovered .any2md.toml → --meta-file → --meta
     # (highest priority last). Each layer deep-merges over the previous.
@@ -306,7 +492,7 @@ def main():
         sys.exit(1)
 
     urls = []
-    file_paths = []
+    file_paths: list[tuple[Path, int | None]] = []
 
     if args.files:
         for f in args.files:
@@ -318,36 +504,26 @@ def main():
             p = Path(f)
             if not p.is_absolute():
                 p = Path.cwd() / p
-            if not p.exists():
+            # One stat answers exists / is-dir / size for the checks below.
+            try:
+                st = p.stat()
+            except OSError:
                 print(f"  NOT FOUND: {f}", file=sys.stderr)
                 continue
-            if p.is_dir():
-                glob_method = p.rglob if args.recursive else p.glob
-                file_paths.extend(
-                    sorted(
-                        fp
-                        for ext in SUPPORTED_EXTENSIONS
-                        for fp in glob_method(f"*{ext}")
-                    )
-                )
+            if stat.S_ISDIR(st.st_mode):
+                file_paths.extend(_scan_dir(p, args.recursive))
                 continue
             if p.suffix.lower() not in SUPPORTED_EXTENSIONS:
                 print(f"  UNSUPPORTED FORMAT: {f}", file=sys.stderr)
                 continue
-            file_paths.append(p)
+            file_paths.append((p, st.st_size))
     elif args.input_dir:
         if not args.input_dir.is_dir():
             print(f"Error: not a directory: {args.input_dir}", file=sys.stderr)
             sys.exit(1)
-        glob_method = args.input_dir.rglob if args.recursive else args.input_dir.glob
-        file_paths = sorted(
-            p for ext in SUPPORTED_EXTENSIONS for p in glob_method(f"*{ext}")
-        )
+        file_paths = _scan_dir(args.input_dir, args.recursive)
     else:
-        glob_method = script_dir.rglob if args.recursive else script_dir.glob
-        file_paths = sorted(
-            p for ext in SUPPORTED_EXTENSIONS for p in glob_method(f"*{ext}")
-        )
+        file_paths = _scan_dir(script_dir, args.recursive)
 
     if not file_paths and not urls:
         print("No supported files to process.")
@@ -360,42 +536,69 @@ def main():
     fail = 0
     skip = 0
 
-    # Process URLs
+    # Pre-flight: drop URLs and files whose output already exists, and
+    # files over the size limit, before any conversion work starts. This
+    # is the authoritative exists check — converters are called with
+    # skip_existence_check=True so they don't stat the output again.
+    # One listdir replaces a stat per input. Queued names are added as we
+    # go, so a second input mapping to the same output name is skipped
+    # just as it would be once the first had been written. A name that
+    # differs from a taken one only in case is a clash only where the
+    # filesystem folds case (macOS and Windows defaults): confirmed
+    # against the disk, or for a name merely queued, by a one-off probe.
+    existing: set[str] = set()
+    if not args.force:
+        try:
+            existing = set(os.listdir(args.output_dir))
+        except OSError:  # output dir not created yet
+            pass
+    existing_folded = {name.casefold() for name in existing}
+    folds_case: bool | None = None
+
+    def _output_taken(out_name: str) -> bool:
+        nonlocal folds_case
+        if out_name in existing:
+            return True
+        if out_name.casefold() not in existing_folded:
+            return False
+        if (args.output_dir / out_name).exists():
+            return True
+        if folds_case is None:
+            folds_case = _folds_case(args.output_dir)
+        return folds_case
+
+    def _claim_output(out_name: str) -> None:
+        if not args.force:
+            existing.add(out_name)
+            existing_folded.add(out_name.casefold())
+
+    pending_urls: list[str] = []
     for url in urls:
         out_name = url_to_filename(url)
-        out_path = args.output_dir / out_name
-        if out_path.exists() and not args.force:
+        if _output_taken(out_name):
             print(f"  SKIP (exists): {out_name}")
             skip += 1
             continue
+        _claim_output(out_name)
+        pending_urls.append(url)
 
-        result = convert_url(
-            url,
-            args.output_dir,
-            options=options,
-            force=args.force,
-        )
-        if result:
-            ok += 1
-        else:
-            fail += 1
-
-    # Process local files
-    for file_path in file_paths:
+    pending_files: list[Path] = []
+    for file_path, file_size in file_paths:
         out_name = sanitize_filename(file_path.name)
-        out_path = args.output_dir / out_name
-        if out_path.exists() and not args.force:
+        if _output_taken(out_name):
             print(f"  SKIP (exists): {out_name}")
             skip += 1
             continue
 
-        # File size check
-        try:
-            file_size = file_path.stat().st_size
-        except OSError as e:
-            print(f"  FAIL: {file_path.name} -- {e}", file=sys.stderr)
-            fail += 1
-            continue
+        # File size check. The size was read during the scan; only a
+        # stat that failed there is retried, to report its error.
+        if file_size is None:
+            try:
+                file_size = file_path.stat().st_size
+            except OSError as e:
+                print(f"  FAIL: {file_path.name} -- {e}", file=sys.stderr)
+                fail += 1
+                continue
 
         if file_size > args.max_file_size:
             print(
@@ -404,17 +607,57 @@ def main():
             )
             skip += 1
             continue
-
-        result = convert_file(
-            file_path,
+        _claim_output(out_name)
+        pending_files.append(file_path)
+
+    jobs = args.jobs or os.cpu_count() or 1
+    pending_total = len(pending_urls) + len(pending_files)
+    if jobs > 1 and pending_total > 1:
+        n_ok, n_fail = _convert_parallel(
+            pending_urls,
+            pending_files,
             args.output_dir,
-            options=options,
-            force=args.force,
+            options,
+            args.force,
+            min(jobs, pending_total),
+            args.quiet,
+            args.verbose,
         )
-        if result:
-            ok += 1
-        else:
-            fail += 1
+        ok += n_ok
+        fail += n_fail
+    else:
+        # A lone input can still use the cores --jobs asked for: the PDF
+        # converter splits large documents into page ranges.
+        set_page_workers(jobs)
+        if pending_urls:
+            # Deferred: the HTML converter drags in trafilatura + lxml.
+            from any2md.converters.html import convert_url
+
+            for url in pending_urls:
+                result = convert_url(
+                    url,
+                    args.output_dir,
+                    options=options,
+                    force=args.force,
+                    skip_existence_check=True,
+                )
+                if result:
+                    ok += 1
+                else:
+                    fail += 1
+
+        for file_path in pending_files:
+            result = convert_file(
+                file_path,
+                args.output_dir,
+                options=options,
+                force=args.force,
+                skip_existence_check=True,
+            )
+            if result:
+                ok += 1
+            else:
+                fail += 1
 
     elapsed = time.time() - start
     warnings_seen = collected_warnings()
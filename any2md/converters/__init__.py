@@ -1,11 +1,40 @@
 """Converter dispatcher for any2md."""
 
+import importlib
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from any2md.pipeline import PipelineOptions
 
-SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".html", ".htm", ".txt"}
+
+def _lazy(modname: str, attr: str) -> Callable[..., bool]:
+    """Return a stand-in for ``modname.attr`` that imports it on first call.
+
+    Converter modules pull in pymupdf, mammoth, trafilatura, lxml etc. at
+    import time; deferring them keeps ``--help`` and single-format runs
+    from paying for backends they never touch.
+    """
+
+    def _call(*args: Any, **kwargs: Any) -> bool:
+        return getattr(importlib.import_module(modname), attr)(*args, **kwargs)
+
+    _call.__name__ = attr
+    _call.__qualname__ = attr
+    return _call
+
+
+# Extension -> converter. Values are lazy thunks (see ``_lazy``).
+CONVERTERS: dict[str, Callable[..., bool]] = {
+    ".pdf": _lazy("any2md.converters.pdf", "convert_pdf"),
+    ".docx": _lazy("any2md.converters.docx", "convert_docx"),
+    ".html": _lazy("any2md.converters.html", "convert_html"),
+    ".htm": _lazy("any2md.converters.html", "convert_html"),
+    ".txt": _lazy("any2md.converters.txt", "convert_txt"),
+}
+# Derived, so a new format is registered in exactly one place.
+SUPPORTED_EXTENSIONS = frozenset(CONVERTERS)
 
 
 # Module-level accumulator of pipeline warnings across a single CLI run.
@@ -57,32 +86,51 @@ def is_verbose() -> bool:
     return _VERBOSE
 
 
+# Processes a single converter may fan out to for intra-document work
+# (currently: pymupdf4llm page ranges). The CLI raises this only when
+# `--jobs` > 1 but there is a single input; batches parallelize across
+# files instead, so workers never spawn pools of their own.
+_PAGE_WORKERS: int = 1
+
+
+def set_page_workers(n: int) -> None:
+    """Allow converters to split one document across ``n`` processes."""
+    global _PAGE_WORKERS
+    _PAGE_WORKERS = max(1, n)
+
+
+def page_workers() -> int:
+    return _PAGE_WORKERS
+
+
 def convert_file(
     file_path: Path,
     output_dir: Path,
     options: PipelineOptions | None = None,
     force: bool = False,
     strip_links_flag: bool = False,
+    skip_existence_check: bool = False,
 ) -> bool:
-    """Dispatch to the appropriate converter based on file extension."""
+    """Dispatch to the appropriate converter based on file extension.
+
+    ``skip_existence_check=True`` tells the converter the caller has
+    already decided this output should be written (``cli.main`` does the
+    SKIP (exists) check up front), so it doesn't stat ``out_path`` again.
+    """
     if options is None:
         options = PipelineOptions(strip_links=strip_links_flag)
     ext = file_path.suffix.lower()
-    if ext == ".pdf":
-        from any2md.converters.pdf import convert_pdf
-
-        return convert_pdf(file_path, output_dir, options=options, force=force)
-    if ext == ".docx":
-        from any2md.converters.docx import convert_docx
-
-        return convert_docx(file_path, output_dir, options=options, force=force)
-    if ext in (".html", ".htm"):
-        from any2md.converters.html import convert_html
-
-        return convert_html(file_path, output_dir, options=options, force=force)
-    if ext == ".txt":
-        from any2md.converters.txt import convert_txt
-
-        return convert_txt(file_path, output_dir, options=options, force=force)
-    print(f"  UNSUPPORTED: {file_path.name} (no converter for {ext})", file=sys.stderr)
-    return False
+    converter = CONVERTERS.get(ext)
+    if converter is None:
+        print(
+            f"  UNSUPPORTED: {file_path.name} (no converter for {ext})",
+            file=sys.stderr,
+        )
+        return False
+    return converter(
+        file_path,
+        output_dir,
+        options=options,
+        force=force,
+        skip_existence_check=skip_existence_check,
+    )
@@ -0,0 +1,166 @@
+"""Streaming DOCX body reader for very large documents.
+
+mammoth builds an HTML DOM of the whole ``word/document.xml`` and that
+HTML is then parsed again to walk it into Markdown — two full trees for
+one document.
+On multi-hundred-page DOCX that dominates wall time and peak memory.
+This module reads ``word/document.xml`` straight out of the zip with
+``lxml.etree.iterparse`` and emits Markdown block by block, clearing
+each block's subtree once it has been written.
+
+It is deliberately structural only: headings (``Heading1``-``Heading6``
+and ``Title`` paragraph styles), paragraphs, bullet items (any ``w:numPr``)
+and tables. Run formatting, hyperlink targets and images are dropped.
+``convert_docx`` uses it only when the document is large enough for that
+trade to pay off, and falls back to mammoth on any parse error.
+"""
+
+from __future__ import annotations
+
+import re
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+from lxml import etree
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P = _W + "p"
+_W_TBL = _W + "tbl"
+_W_TR = _W + "tr"
+_W_TC = _W + "tc"
+_W_T = _W + "t"
+_W_TAB = _W + "tab"
+_W_BR = _W + "br"
+_W_CR = _W + "cr"
+_W_PSTYLE = f"{_W}pPr/{_W}pStyle"
+_W_NUMPR = f"{_W}pPr/{_W}numPr"
+_W_ILVL = f"{_W}pPr/{_W}numPr/{_W}ilvl"
+_W_VAL = _W + "val"
+
+_DOCUMENT_XML = "word/document.xml"
+_HEADING_STYLE_RE = re.compile(r"^heading\s*([1-6])$", re.IGNORECASE)
+
+
+def document_xml_size(docx_path: Path) -> int:
+    """Declared uncompressed size of ``word/document.xml`` (0 if absent)."""
+    with zipfile.ZipFile(docx_path) as z:
+        try:
+            return z.getinfo(_DOCUMENT_XML).file_size
+        except KeyError:
+            return 0
+
+
+def _paragraph_text(p: etree._Element) -> str:
+    parts: list[str] = []
+    for node in p.iter(_W_T, _W_TAB, _W_BR, _W_CR):
+        tag = node.tag
+        if tag == _W_T:
+            parts.append(node.text or "")
+        elif tag == _W_TAB:
+            parts.append("\t")
+        else:
+            parts.append("\n")
+    return "".join(parts).strip()
+
+
+def _heading_level(p: etree._Element) -> int:
+    style = p.find(_W_PSTYLE)
+    if style is None:
+        return 0
+    val = style.get(_W_VAL) or ""
+    if val.lower() == "title":
+        return 1
+    m = _HEADING_STYLE_RE.match(val)
+    return int(m.group(1)) if m else 0
+
+
+def _list_level(p: etree._Element) -> int | None:
+    if p.find(_W_NUMPR) is None:
+        return None
+    ilvl = p.find(_W_ILVL)
+    try:
+        return int(ilvl.get(_W_VAL, "0")) if ilvl is not None else 0
+    except ValueError:
+        return 0
+
+
+def _table_markdown(tbl: etree._Element) -> str:
+    rows: list[list[str]] = []
+    # Direct rows only; a nested table's text stays inside its outer cell.
+    for tr in tbl.iterchildren(_W_TR):
+        cells = []
+        for tc in tr.iterchildren(_W_TC):
+            text = " ".join(t for t in (_paragraph_text(p) for p in tc.iter(_W_P)) if t)
+            cells.append(text.replace("\n", " ").replace("|", "\\|"))
+        if cells:
+            rows.append(cells)
+    if not rows:
+        return ""
+    width = max(len(r) for r in rows)
+    rows = [r + [""] * (width - len(r)) for r in rows]
+    lines = ["| " + " | ".join(rows[0]) + " |", "|" + " --- |" * width]
+    lines.extend("| " + " | ".join(r) + " |" for r in rows[1:])
+    return "\n".join(lines)
+
+
+def _release(elem: etree._Element) -> None:
+    """Drop a finished block and everything parsed before it."""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def iter_docx_blocks(docx_path: Path) -> Iterator[str]:
+    """Yield Markdown blocks from ``word/document.xml`` in document order.
+
+    Consecutive list items are yielded as one block. Raises
+    ``KeyError`` / ``zipfile.BadZipFile`` / ``etree.LxmlError`` on a
+    malformed package; callers fall back to mammoth.
+    """
+    list_lines: list[str] = []
+    with zipfile.ZipFile(docx_path) as z, z.open(_DOCUMENT_XML) as stream:
+        events = etree.iterparse(
+            stream,
+            events=("end",),
+            tag=(_W_P, _W_TBL),
+            resolve_entities=False,
+            no_network=True,
+            load_dtd=False,
+        )
+        for _event, elem in events:
+            # Paragraphs inside tables (or text boxes inside paragraphs)
+            # are rendered by their enclosing block.
+            if next(elem.iterancestors(_W_P, _W_TBL), None) is not None:
+                continue
+            if elem.tag == _W_TBL:
+                block = _table_markdown(elem)
+                level = None
+            else:
+                text = _paragraph_text(elem)
+                level = _list_level(elem) if text else None
+                heading = _heading_level(elem) if text else 0
+                if level is not None:
+                    block = "  " * level + "- " + text
+                elif heading:
+                    block = "#" * heading + " " + text
+                else:
+                    block = text
+            _release(elem)
+            if level is not None:
+                list_lines.append(block)
+                continue
+            if list_lines:
+                yield "\n".join(list_lines)
+                list_lines = []
+            if block:
+                yield block
+    if list_lines:
+        yield "\n".join(list_lines)
+
+
+def docx_to_markdown(docx_path: Path) -> str:
+    """Whole-document convenience wrapper over ``iter_docx_blocks``."""
+    return "\n\n".join(iter_docx_blocks(docx_path)) + "\n"
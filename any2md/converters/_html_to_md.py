@@ -0,0 +1,267 @@
+"""Direct lxml HTML-to-Markdown walker.
+
+Replaces markdownify on the two lanes that hand us already-formed HTML:
+mammoth's DOCX output (a small, fixed vocabulary — headings, paragraphs,
+lists, tables, inline emphasis, links, images) and the pre-cleaned page
+in the HTML fallback. markdownify goes through BeautifulSoup, which
+re-parses the HTML into its own tree and then dispatches per node via
+``getattr``; here lxml parses once (or the caller supplies the tree) and
+each element is looked up in a plain dict of handlers.
+
+Output follows the markdownify settings the converters used before —
+ATX headings, ``-`` bullets, ``**``/``*`` emphasis, GFM tables with the
+first row as header — so the shared pipeline sees the same shapes.
+Elements without a handler contribute their children's text.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+import lxml.html
+from lxml import etree
+
+_WS_RE = re.compile(r"\s+")
+_ESCAPE_RE = re.compile(r"([*_])")
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+_SKIP_TAGS = frozenset({"head", "script", "style", "template", "noscript"})
+_BLOCK_CONTAINERS = frozenset(
+    {"div", "section", "article", "main", "body", "html", "figure", "dl", "dd", "dt"}
+)
+
+
+@dataclass(frozen=True)
+class _Ctx:
+    strip_images: bool
+    pre: bool = False
+    in_table: bool = False
+
+
+_Handler = Callable[[lxml.html.HtmlElement, _Ctx], str]
+
+
+def _text(s: str, ctx: _Ctx) -> str:
+    if ctx.pre:
+        return s
+    return _ESCAPE_RE.sub(r"\\\1", _WS_RE.sub(" ", s))
+
+
+def _children(el: etree._Element, ctx: _Ctx) -> str:
+    parts: list[str] = []
+    if el.text:
+        parts.append(_text(el.text, ctx))
+    after_block = False
+    for child in el:
+        # Comments and processing instructions have a non-str tag.
+        if isinstance(child.tag, str):
+            out = _node(child, ctx)
+            # Inter-element whitespace must not leave a stray " " line
+            # between two blocks.
+            if out.startswith("\n") and parts and not ctx.pre:
+                parts[-1] = parts[-1].rstrip(" ")
+            parts.append(out)
+            after_block = out.endswith("\n")
+        if child.tail:
+            tail = _text(child.tail, ctx)
+            if after_block and not ctx.pre:
+                tail = tail.lstrip(" ")
+            if tail:
+                parts.append(tail)
+                after_block = False
+    return "".join(parts)
+
+
+def _node(el: etree._Element, ctx: _Ctx) -> str:
+    tag = el.tag.lower()
+    handler = _HANDLERS.get(tag)
+    if handler is not None:
+        return handler(el, ctx)
+    if tag in _SKIP_TAGS:
+        return ""
+    if tag in _BLOCK_CONTAINERS:
+        return _block(_children(el, ctx).strip())
+    return _children(el, ctx)
+
+
+def _block(text: str) -> str:
+    return f"\n\n{text}\n\n" if text else ""
+
+
+def _wrap(inner: str, mark: str) -> str:
+    """Wrap ``inner`` in ``mark`` with surrounding whitespace kept outside."""
+    core = inner.strip()
+    if not core:
+        return inner
+    lead = " " if inner[0].isspace() else ""
+    trail = " " if inner[-1].isspace() else ""
+    return f"{lead}{mark}{core}{mark}{trail}"
+
+
+def _heading(level: int) -> _Handler:
+    prefix = "#" * level + " "
+
+    def convert(el, ctx):
+        text = _children(el, ctx).replace("\n", " ").strip()
+        return _block(prefix + text) if text else ""
+
+    return convert
+
+
+def _paragraph(el, ctx):
+    return _block(_children(el, ctx).strip())
+
+
+def _br(el, ctx):
+    return " " if ctx.in_table else "  \n"
+
+
+def _emphasis(mark: str) -> _Handler:
+    def convert(el, ctx):
+        return _wrap(_children(el, ctx), mark)
+
+    return convert
+
+
+def _code(el, ctx):
+    if ctx.pre:
+        return _children(el, ctx)
+    text = el.text_content()
+    return f"`{text}`" if text else ""
+
+
+def _pre(el, ctx):
+    body = _children(el, replace(ctx, pre=True)).strip("\n")
+    return f"\n\n```\n{body}\n```\n\n" if body else ""
+
+
+def _link(el, ctx):
+    text = _children(el, ctx)
+    href = el.get("href")
+    if not href or not text.strip():
+        return text
+    title = el.get("title")
+    suffix = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+    core = text.strip()
+    lead = " " if text[0].isspace() else ""
+    trail = " " if text[-1].isspace() else ""
+    return f"{lead}[{core}]({href}{suffix}){trail}"
+
+
+def _image(el, ctx):
+    if ctx.strip_images:
+        return ""
+    src = el.get("src")
+    if not src:
+        return ""
+    return f"![{el.get('alt') or ''}]({src})"
+
+
+def _list(el, ctx):
+    ordered = el.tag.lower() == "ol"
+    try:
+        number = int(el.get("start", "1"))
+    except ValueError:
+        number = 1
+    items: list[str] = []
+    for li in el:
+        if not isinstance(li.tag, str) or li.tag.lower() != "li":
+            continue
+        marker = f"{number}." if ordered else "-"
+        number += 1
+        body = _BLANK_RUN_RE.sub("\n", _children(li, ctx).strip())
+        body = body.replace("\n\n", "\n")
+        indent = " " * (len(marker) + 1)
+        items.append(f"{marker} " + body.replace("\n", "\n" + indent))
+    return _block("\n".join(items))
+
+
+def _list_item(el, ctx):
+    # A stray <li> outside any list still reads as a bullet.
+    return _block("- " + _children(el, ctx).strip())
+
+
+def _table_rows(table: etree._Element) -> list[etree._Element]:
+    # Direct rows only; a nested table is flattened into its outer cell.
+    return table.xpath("./tr | ./thead/tr | ./tbody/tr | ./tfoot/tr")
+
+
+def _table(el, ctx):
+    cell_ctx = replace(ctx, in_table=True)
+    rows: list[list[str]] = []
+    for tr in _table_rows(el):
+        cells = [
+            _WS_RE.sub(" ", _children(cell, cell_ctx)).strip().replace("|", r"\|")
+            for cell in tr
+            if isinstance(cell.tag, str) and cell.tag.lower() in ("td", "th")
+        ]
+        if cells:
+            rows.append(cells)
+    if not rows:
+        return ""
+    width = max(len(r) for r in rows)
+    rows = [r + [""] * (width - len(r)) for r in rows]
+    lines = ["| " + " | ".join(rows[0]) + " |", "|" + " --- |" * width]
+    lines.extend("| " + " | ".join(r) + " |" for r in rows[1:])
+    return _block("\n".join(lines))
+
+
+def _blockquote(el, ctx):
+    text = _BLANK_RUN_RE.sub("\n\n", _children(el, ctx).strip())
+    if not text:
+        return ""
+    return _block("\n".join(f"> {line}" if line else ">" for line in text.split("\n")))
+
+
+def _hr(el, ctx):
+    return "\n\n---\n\n"
+
+
+_HANDLERS: dict[str, _Handler] = {
+    **{f"h{n}": _heading(n) for n in range(1, 7)},
+    "p": _paragraph,
+    "br": _br,
+    "strong": _emphasis("**"),
+    "b": _emphasis("**"),
+    "em": _emphasis("*"),
+    "i": _emphasis("*"),
+    "s": _emphasis("~~"),
+    "del": _emphasis("~~"),
+    "strike": _emphasis("~~"),
+    "code": _code,
+    "kbd": _code,
+    "pre": _pre,
+    "a": _link,
+    "img": _image,
+    "ul": _list,
+    "ol": _list,
+    "li": _list_item,
+    "table": _table,
+    "blockquote": _blockquote,
+    "hr": _hr,
+}
+
+
+def html_to_markdown(
+    html: str | lxml.html.HtmlElement, *, strip_images: bool = True
+) -> str:
+    """Render ``html`` (a fragment, a document, or a parsed tree) as Markdown.
+
+    With ``strip_images`` (the default) ``<img>`` elements are dropped;
+    otherwise they become ``![alt](src)``. Returns ``""`` for input with
+    no renderable content.
+    """
+    if isinstance(html, str):
+        if not html.strip():
+            return ""
+        try:
+            root = lxml.html.fragment_fromstring(html, create_parent="div")
+        except etree.ParserError:
+            return ""
+    else:
+        root = html
+    md = _BLANK_RUN_RE.sub("\n\n", _node(root, _Ctx(strip_images=strip_images)))
+    md = md.strip("\n")
+    return md + "\n" if md else ""
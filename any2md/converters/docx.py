@@ -9,6 +9,7 @@ produces the markdown body.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 import sys
@@ -19,20 +20,26 @@ from defusedxml.ElementTree import parse as _xml_parse
 from datetime import date
 from pathlib import Path
 
-import mammoth
-import markdownify
+from lxml import etree
 
 from any2md import pipeline
 from any2md._docling import has_docling
 from any2md.converters import add_warnings, is_quiet
-from any2md.frontmatter import SourceMeta, compose
+from any2md.converters._docx_stream import document_xml_size, docx_to_markdown
+from any2md.converters._html_to_md import html_to_markdown
+from any2md.frontmatter import SourceMeta, compose_parts
 from any2md.heuristics import filter_organization
 from any2md.pipeline import PipelineOptions
-from any2md.utils import atomic_write_text, sanitize_filename
+from any2md.utils import atomic_write_text, count_words, sanitize_filename
 
 
 _DOCLING_MSWORD_LOGGER = "docling.backend.msword_backend"
 
+# Bodies at least this large skip mammoth's HTML DOM + the Markdown
+# walk over it and go through the streaming reader instead (structure only —
+# see any2md.converters._docx_stream).
+_STREAM_MIN_DOCUMENT_BYTES = 8 * 1024 * 1024
+
 _LOG_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
 
 
@@ -167,6 +174,18 @@ def _read_docx_metadata(docx_path: Path) -> dict[str, object]:
     return out
 
 
+@functools.cache
+def _docling_converter():
+    """The process's Docling ``DocumentConverter``, built on first use.
+
+    Reused so a batch initializes Docling's DOCX pipeline once rather
+    than once per file.
+    """
+    from docling.document_converter import DocumentConverter
+
+    return DocumentConverter()
+
+
 def _extract_via_docling(docx_path: Path) -> tuple[str, str, list[str]]:
     """Returns (markdown, 'docling', captured_warnings).
 
@@ -174,39 +193,59 @@ def _extract_via_docling(docx_path: Path) -> tuple[str, str, list[str]]:
     Docling's ``msword_backend`` logger during the conversion. It is
     empty for clean runs. Raises on Docling errors.
     """
-    from docling.document_converter import DocumentConverter
-
-    converter = DocumentConverter()
+    converter = _docling_converter()
     with _DoclingMswordWarningCapture() as cap:
         result = converter.convert(str(docx_path))
     return result.document.export_to_markdown(), "docling", list(cap.messages)
 
 
 def _extract_via_mammoth(docx_path: Path, options: PipelineOptions) -> tuple[str, str]:
+    # Deferred: ~60 ms of import that Docling and streaming runs never use.
+    import mammoth
+
     with open(docx_path, "rb") as f:
         html_result = mammoth.convert_to_html(f)
-    md = markdownify.markdownify(
-        html_result.value,
-        heading_style="ATX",
-        strip=["img"] if not options.save_images else [],
-        bullets="-",
-    )
+    md = html_to_markdown(html_result.value, strip_images=not options.save_images)
+    # The label names the lane, not the renderer; kept stable for consumers.
     return md, "mammoth+markdownify"
 
 
+def _extract_without_docling(
+    docx_path: Path, options: PipelineOptions
+) -> tuple[str, str]:
+    """Auto-selected non-Docling lane: mammoth, or streaming for huge bodies.
+
+    ``--save-images`` always takes mammoth (the streaming reader drops
+    images), as does an explicit ``--backend mammoth``, which calls
+    ``_extract_via_mammoth`` directly.
+    """
+    if not options.save_images:
+        try:
+            if document_xml_size(docx_path) >= _STREAM_MIN_DOCUMENT_BYTES:
+                return docx_to_markdown(docx_path), "docx_stream"
+        except (KeyError, zipfile.BadZipFile, etree.LxmlError) as e:
+            print(
+                f"  WARN: streaming read failed for {docx_path.name}: {e}; "
+                f"falling back to mammoth.",
+                file=sys.stderr,
+            )
+    return _extract_via_mammoth(docx_path, options)
+
+
 def convert_docx(
     docx_path: Path,
     output_dir: Path,
     options: PipelineOptions | None = None,
     force: bool = False,
     strip_links_flag: bool = False,
+    skip_existence_check: bool = False,
 ) -> bool:
     if options is None:
         options = PipelineOptions(strip_links=strip_links_flag)
 
     out_name = sanitize_filename(docx_path.name)
     out_path = output_dir / out_name
-    if out_path.exists() and not force:
+    if not (force or skip_existence_check) and out_path.exists():
         print(f"  SKIP (exists): {out_name}")
         return True
 
@@ -241,11 +280,11 @@ def convert_docx(
                     f"falling back to mammoth.",
                     file=sys.stderr,
                 )
-                md_text, extracted_via = _extract_via_mammoth(docx_path, options)
+                md_text, extracted_via = _extract_without_docling(docx_path, options)
                 lane = "text"
                 docling_warnings = []
         else:
-            md_text, extracted_via = _extract_via_mammoth(docx_path, options)
+            md_text, extracted_via = _extract_without_docling(docx_path, options)
             lane = "text"
 
         # v1.0.5: Docling's DOCX backend silently drops list items in a
@@ -290,7 +329,7 @@ def convert_docx(
             ),
             keywords=props["keywords"],
             pages=None,
-            word_count=len(md_text.split()),
+            word_count=count_words(md_text),
             source_file=docx_path.name,
             source_url=None,
             doc_type="docx",
@@ -298,10 +337,11 @@ def convert_docx(
             lane=lane,
             produced_by=props["produced_by"],
         )
-        full = compose(md_text, meta, options, overrides=options.frontmatter_overrides)
+        header, body = compose_parts(
+            md_text, meta, options, overrides=options.frontmatter_overrides
+        )
 
-        output_dir.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, full)
+        atomic_write_text(out_path, header, body)
         wc = meta.word_count or 0
         suffix = f", {len(warnings)} warning(s)" if warnings else ""
         if not is_quiet():
@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
+import codecs
 import sys
+from copy import copy
 from datetime import date
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 
-import markdownify
+import lxml.html
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml import etree
+from trafilatura import load_html
 
 from any2md import pipeline
-from any2md._http import safe_fetch
+from any2md._http import safe_fetch, safe_stream
 from any2md.converters import add_warnings, is_quiet
-from any2md.frontmatter import SourceMeta, compose
+from any2md.converters._html_to_md import html_to_markdown
+from any2md.frontmatter import SourceMeta, compose_parts
 from any2md.pipeline import PipelineOptions
 from any2md.utils import (
     atomic_write_text,
+    count_words,
     read_text_with_fallback,
     sanitize_filename,
     url_to_filename,
@@ -26,6 +31,17 @@ from any2md.utils import (
 
 _MAX_FILE_SIZE = 100 * 1024 * 1024
 
+# Same settings trafilatura's own loader parses with, so a tree we build
+# is interchangeable with the one it would build from the raw string.
+_TREE_PARSER_KW = {
+    "collect_ids": False,
+    "default_doctype": False,
+    "remove_comments": True,
+    "remove_pis": True,
+}
+
+HtmlSource = str | lxml.html.HtmlElement
+
 
 def fetch_url(url: str) -> tuple[str | None, str | None]:
     """Fetch HTML from a URL using the SSRF-safe fetcher.
@@ -42,6 +58,39 @@ def fetch_url(url: str) -> tuple[str | None, str | None]:
     return body.decode("utf-8", errors="replace"), None
 
 
+def fetch_and_parse(url: str) -> tuple[lxml.html.HtmlElement | None, str | None]:
+    """Fetch ``url`` and parse it as the body streams in.
+
+    Chunks from ``safe_stream`` are decoded incrementally (UTF-8,
+    ``errors="replace"`` — same as ``fetch_url``) and fed to an
+    ``HTMLPullParser``, so parsing overlaps the download and the raw
+    body is never held as one string. Returns ``(root, None)`` on
+    success or ``(None, error_message)`` on failure.
+    """
+    parser = etree.HTMLPullParser(events=("end",), **_TREE_PARSER_KW)
+    parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def _feed(chunk: bytes) -> None:
+        parser.feed(decoder.decode(chunk))
+        for _event in parser.read_events():
+            pass
+
+    _headers, err = safe_stream(url, _feed)
+    if err:
+        return None, err
+    tail = decoder.decode(b"", final=True)
+    try:
+        if tail:
+            parser.feed(tail)
+        root = parser.close()
+    except etree.LxmlError:
+        root = None
+    if root is None:
+        return None, f"empty body for {url}"
+    return root, None
+
+
 def _http_last_modified(url: str) -> str | None:
     """Single HEAD request for Last-Modified. Best-effort.
 
@@ -59,37 +108,61 @@ def _http_last_modified(url: str) -> str | None:
         return None
 
 
-def _bs4_preclean(html: str) -> str:
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup.find_all(
-        ["script", "style", "nav", "header", "footer", "aside", "iframe"]
-    ):
-        tag.decompose()
-    return str(soup)
+_BOILERPLATE_TAGS = ("script", "style", "nav", "header", "footer", "aside", "iframe")
+
+
+def _preclean_tree(html: HtmlSource) -> lxml.html.HtmlElement | None:
+    """Parse ``html`` (or copy a tree) with boilerplate elements removed.
+
+    ``etree.strip_elements`` removes every matching tag in one pass in
+    libxml2; tails are kept so text following a removed element survives.
+    A pre-parsed tree is copied first so the caller's tree is untouched.
+    Returns ``None`` when there is nothing to parse.
+    """
+    if isinstance(html, lxml.html.HtmlElement):
+        tree = copy(html)
+    else:
+        if not html.strip():
+            return None
+        try:
+            try:
+                tree = lxml.html.document_fromstring(html)
+            except ValueError:
+                # lxml refuses str input that carries an XML encoding declaration.
+                tree = lxml.html.document_fromstring(html.encode("utf-8"))
+        except etree.ParserError:  # nothing parseable (e.g. comments only)
+            return None
+    etree.strip_elements(tree, *_BOILERPLATE_TAGS, with_tail=False)
+    return tree
 
 
-def _extract(raw_html: str) -> tuple[str, str]:
+def _for_trafilatura(html: HtmlSource) -> HtmlSource:
+    """Hand trafilatura its own copy of a tree — older releases prune in place."""
+    return copy(html) if isinstance(html, lxml.html.HtmlElement) else html
+
+
+def _extract(raw_html: HtmlSource) -> tuple[str, str]:
     """Returns (markdown, extracted_via)."""
     md = trafilatura.extract(
-        raw_html,
+        _for_trafilatura(raw_html),
         output_format="markdown",
         include_formatting=True,
         include_links=True,
     )
     if md:
         return md, "trafilatura"
-    cleaned = _bs4_preclean(raw_html)
-    md = markdownify.markdownify(cleaned, heading_style="ATX", strip=["img"])
+    cleaned = _preclean_tree(raw_html)
+    md = html_to_markdown(cleaned) if cleaned is not None else ""
     return md, "trafilatura+bs4_fallback"
 
 
 def _extract_metadata(
-    raw_html: str,
+    raw_html: HtmlSource,
 ) -> tuple[str | None, list[str], str | None, str | None, list[str]]:
     """Returns (title_hint, authors, organization, date, keywords)."""
     try:
         bare = trafilatura.bare_extraction(
-            raw_html, with_metadata=True, output_format="python"
+            _for_trafilatura(raw_html), with_metadata=True, output_format="python"
         )
     except Exception:  # noqa: BLE001
         return None, [], None, None, []
@@ -124,7 +197,15 @@ def convert_html(
     strip_links_flag: bool = False,
     source_url: str | None = None,
     html_content: str | None = None,
+    html_tree: lxml.html.HtmlElement | None = None,
+    skip_existence_check: bool = False,
 ) -> bool:
+    """Convert an HTML file, fetched body, or pre-parsed tree to Markdown.
+
+    The source is, in priority order: ``html_tree`` (already parsed, e.g.
+    by ``fetch_and_parse``), ``html_content`` (raw markup), then the file
+    at ``html_path``. ``skip_existence_check`` is as for ``convert_file``.
+    """
     if options is None:
         options = PipelineOptions(strip_links=strip_links_flag)
 
@@ -139,12 +220,15 @@ def convert_html(
         return False
 
     out_path = output_dir / out_name
-    if out_path.exists() and not force:
+    if not (force or skip_existence_check) and out_path.exists():
         print(f"  SKIP (exists): {out_name}")
         return True
 
     try:
-        if html_content is not None:
+        raw_html: HtmlSource
+        if html_tree is not None:
+            raw_html = html_tree
+        elif html_content is not None:
             raw_html = html_content
         elif html_path is not None:
             file_size = html_path.stat().st_size
@@ -159,6 +243,12 @@ def convert_html(
         else:
             print("  FAIL: html_content or html_path required", file=sys.stderr)
             return False
+        if isinstance(raw_html, str):
+            # Parse once with trafilatura's own loader; extraction, metadata
+            # and the fallback then share (copies of) that one tree.
+            tree = load_html(raw_html) if raw_html.strip() else None
+            if tree is not None:
+                raw_html = tree
 
         md_text, extracted_via = _extract(raw_html)
         title_hint, authors, org, doc_date, keywords = _extract_metadata(raw_html)
@@ -178,17 +268,18 @@ def convert_html(
             date=doc_date,
             keywords=keywords,
             pages=None,
-            word_count=len(md_text.split()),
+            word_count=count_words(md_text),
             source_file=html_path.name if html_path else None,
             source_url=source_url,
             doc_type="html",
             extracted_via=extracted_via,
             lane="text",
         )
-        full = compose(md_text, meta, options, overrides=options.frontmatter_overrides)
+        header, body = compose_parts(
+            md_text, meta, options, overrides=options.frontmatter_overrides
+        )
 
-        output_dir.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, full)
+        atomic_write_text(out_path, header, body)
         wc = meta.word_count or 0
         suffix = f", {len(warnings)} warning(s)" if warnings else ""
         if not is_quiet():
@@ -206,9 +297,10 @@ def convert_url(
     options: PipelineOptions | None = None,
     force: bool = False,
     strip_links_flag: bool = False,
+    skip_existence_check: bool = False,
 ) -> bool:
     """Convenience wrapper: fetch a URL and convert to Markdown."""
-    html_content, err = fetch_url(url)
+    html_tree, err = fetch_and_parse(url)
     if err:
         print(f"  FAIL: {url} -- {err}", file=sys.stderr)
         return False
@@ -219,5 +311,6 @@ def convert_url(
         force=force,
         strip_links_flag=strip_links_flag,
         source_url=url,
-        html_content=html_content,
+        html_tree=html_tree,
+        skip_existence_check=skip_existence_check,
     )
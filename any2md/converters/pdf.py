@@ -9,8 +9,12 @@ beyond surfacing the requested backend in extracted_via.
 
 from __future__ import annotations
 
+import functools
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from itertools import pairwise
 from pathlib import Path
 
 import pymupdf
@@ -18,8 +22,8 @@ import pymupdf4llm
 
 from any2md import pipeline
 from any2md._docling import has_docling, install_hint
-from any2md.converters import add_warnings, is_quiet
-from any2md.frontmatter import SourceMeta, compose
+from any2md.converters import add_warnings, is_quiet, page_workers
+from any2md.frontmatter import SourceMeta, compose_parts
 from any2md.heuristics import filter_organization
 from any2md.pipeline import PipelineOptions
 from any2md.utils import atomic_write_text, safe_dir_name, sanitize_filename
@@ -75,66 +79,84 @@ def pdf_looks_complex(pdf_path: Path) -> bool:
     """
     try:
         with pymupdf.open(str(pdf_path)) as doc:
-            page_count = len(doc)
-            if page_count <= 5:
-                return False
+            return _doc_looks_complex(doc)
+    except (OSError, ValueError, RuntimeError):
+        return False
 
-            sample_idxs = (
-                list(range(page_count))
-                if page_count <= 5
-                else [int(i * page_count / 5) for i in range(5)]
-            )
 
-            total_chars = 0
-            multi_column_seen = False
-            for idx in sample_idxs:
-                page = doc[idx]
-                text = page.get_text("text") or ""
-                total_chars += len(text)
-                # Multi-column heuristic: collect block x-positions; if there
-                # are clusters around two distinct x ranges with > 100 px
-                # separation, flag.
-                blocks = page.get_text("blocks") or []
-                xs = sorted({round(b[0], 0) for b in blocks if len(b) >= 4})
-                if len(xs) >= 4:
-                    # Check if there's a gap > page_width * 0.2 between
-                    # consecutive x-starts.
-                    pw = page.rect.width or 612
-                    for a, b in zip(xs, xs[1:]):
-                        if b - a > pw * 0.2:
-                            multi_column_seen = True
-                            break
-
-            avg_chars = total_chars / max(len(sample_idxs), 1)
-            scanned_signal = avg_chars < 200
-            return multi_column_seen or scanned_signal
+def _doc_looks_complex(doc: "pymupdf.Document") -> bool:
+    """``pdf_looks_complex`` on an already-open document."""
+    try:
+        page_count = len(doc)
+        if page_count <= 5:
+            return False
+
+        sample_idxs = (
+            list(range(page_count))
+            if page_count <= 5
+            else [int(i * page_count / 5) for i in range(5)]
+        )
+
+        total_chars = 0
+        multi_column_seen = False
+        for idx in sample_idxs:
+            page = doc[idx]
+            text = page.get_text("text") or ""
+            total_chars += len(text)
+            # Multi-column heuristic: collect block x-positions; if there
+            # are clusters around two distinct x ranges with > 100 px
+            # separation, flag.
+            blocks = page.get_text("blocks") or []
+            xs = sorted({round(b[0], 0) for b in blocks if len(b) >= 4})
+            if len(xs) >= 4:
+                # Check if there's a gap > page_width * 0.2 between
+                # consecutive x-starts.
+                pw = page.rect.width or 612
+                for a, b in zip(xs, xs[1:]):
+                    if b - a > pw * 0.2:
+                        multi_column_seen = True
+                        break
+
+        avg_chars = total_chars / max(len(sample_idxs), 1)
+        scanned_signal = avg_chars < 200
+        return multi_column_seen or scanned_signal
     except (OSError, ValueError, RuntimeError):
         return False
 
 
-def _extract_via_docling(
-    pdf_path: Path, options: PipelineOptions, output_dir: Path
-) -> tuple[str, str]:
-    """Returns (markdown, 'docling'). Raises on Docling errors.
+@functools.cache
+def _docling_converter(do_ocr: bool, generate_picture_images: bool):
+    """One Docling ``DocumentConverter`` per option set, per process.
 
-    When ``options.save_images`` is True, extracted picture images are
-    written to ``<output_dir>/images/<pdf_stem>/imgN.png``.
+    The converter initializes its PDF pipeline (layout and table models)
+    on first use and keeps it, so reusing one across a batch loads the
+    models once instead of once per file.
     """
     from docling.datamodel.base_models import InputFormat
     from docling.datamodel.pipeline_options import PdfPipelineOptions
     from docling.document_converter import DocumentConverter, PdfFormatOption
 
     pipeline_opts = PdfPipelineOptions(
-        do_ocr=options.ocr_figures,
+        do_ocr=do_ocr,
         do_table_structure=True,
-        generate_picture_images=options.save_images,
+        generate_picture_images=generate_picture_images,
     )
-
-    converter = DocumentConverter(
+    return DocumentConverter(
         format_options={
             InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_opts),
         }
     )
+
+
+def _extract_via_docling(
+    pdf_path: Path, options: PipelineOptions, output_dir: Path
+) -> tuple[str, str]:
+    """Returns (markdown, 'docling'). Raises on Docling errors.
+
+    When ``options.save_images`` is True, extracted picture images are
+    written to ``<output_dir>/images/<pdf_stem>/imgN.png``.
+    """
+    converter = _docling_converter(options.ocr_figures, options.save_images)
     result = converter.convert(str(pdf_path))
 
     if options.save_images:
@@ -165,14 +187,58 @@ def _extract_via_docling(
     return md, "docling"
 
 
-def _extract_via_pymupdf4llm(doc: "pymupdf.Document") -> tuple[str, str]:
-    md = pymupdf4llm.to_markdown(
-        doc,
-        write_images=False,
-        show_progress=False,
-        force_text=True,
-    )
-    return md, "pymupdf4llm"
+_PYMUPDF4LLM_KW = {"write_images": False, "show_progress": False, "force_text": True}
+
+# Split a document across page workers only when each worker gets at
+# least this many pages; below that, process start-up (~0.3 s to import
+# pymupdf4llm) outweighs the layout work saved.
+_MIN_PAGES_PER_WORKER = 8
+
+
+def _pymupdf4llm_page_range(
+    pdf_path: str, start: int, stop: int, hdr_info: object
+) -> str:
+    """Render pages ``[start, stop)`` in a worker process.
+
+    PyMuPDF documents must not be shared across threads, so each worker
+    opens its own handle. Header levels come from ``hdr_info``, scanned
+    once over the whole document by the parent, so a range never ranks
+    its font sizes differently from the serial run and concatenating the
+    ranges reproduces the serial result.
+    """
+    with pymupdf.open(pdf_path) as doc:
+        return pymupdf4llm.to_markdown(
+            doc, pages=list(range(start, stop)), hdr_info=hdr_info, **_PYMUPDF4LLM_KW
+        )
+
+
+def _page_ranges(page_count: int, workers: int) -> list[tuple[int, int]]:
+    n = min(workers, page_count // _MIN_PAGES_PER_WORKER)
+    bounds = [page_count * i // n for i in range(n + 1)] if n > 1 else []
+    return list(pairwise(bounds))
+
+
+def _extract_via_pymupdf4llm(
+    doc: "pymupdf.Document", pdf_path: Path | None = None
+) -> tuple[str, str]:
+    # Layout mode (``pymupdf_layout`` installed) analyses the document as
+    # a whole and takes no ``hdr_info``, so only the legacy renderer is
+    # split by page range.
+    splittable = pdf_path is not None and hasattr(pymupdf4llm, "IdentifyHeaders")
+    ranges = _page_ranges(len(doc), page_workers()) if splittable else []
+    if not ranges:
+        return pymupdf4llm.to_markdown(doc, **_PYMUPDF4LLM_KW), "pymupdf4llm"
+    hdr_info = pymupdf4llm.IdentifyHeaders(doc)
+    with ProcessPoolExecutor(
+        max_workers=len(ranges), mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        parts = pool.map(
+            _pymupdf4llm_page_range,
+            [str(pdf_path)] * len(ranges),
+            *zip(*ranges),
+            [hdr_info] * len(ranges),
+        )
+        return "".join(parts), "pymupdf4llm"
 
 
 def convert_pdf(
@@ -181,13 +247,14 @@ def convert_pdf(
     options: PipelineOptions | None = None,
     force: bool = False,
     strip_links_flag: bool = False,
+    skip_existence_check: bool = False,
 ) -> bool:
     if options is None:
         options = PipelineOptions(strip_links=strip_links_flag)
 
     out_name = sanitize_filename(pdf_path.name)
     out_path = output_dir / out_name
-    if out_path.exists() and not force:
+    if not (force or skip_existence_check) and out_path.exists():
         print(f"  SKIP (exists): {out_name}")
         return True
 
@@ -216,17 +283,17 @@ def convert_pdf(
         else:
             use_docling = has_docling()
 
-        if not use_docling and options.backend is None and pdf_looks_complex(pdf_path):
-            install_hint()
-
-        # Always extract metadata via PyMuPDF — independent of which
-        # backend produces the markdown body.
+        # One open serves the complexity probe, the metadata (always read
+        # via PyMuPDF, whichever backend produces the body) and the
+        # pymupdf4llm extraction.
         with pymupdf.open(str(pdf_path)) as doc:
+            if not use_docling and options.backend is None and _doc_looks_complex(doc):
+                install_hint()
             page_count = len(doc)
             props = _parse_pdf_metadata(doc)
             fallback_md = None
             if not use_docling:
-                fallback_md, extracted_via = _extract_via_pymupdf4llm(doc)
+                fallback_md, extracted_via = _extract_via_pymupdf4llm(doc, pdf_path)
                 lane = "text"
 
         if use_docling:
@@ -242,7 +309,7 @@ def convert_pdf(
                     file=sys.stderr,
                 )
                 with pymupdf.open(str(pdf_path)) as doc:
-                    md_text, extracted_via = _extract_via_pymupdf4llm(doc)
+                    md_text, extracted_via = _extract_via_pymupdf4llm(doc, pdf_path)
                 lane = "text"
         else:
             md_text = fallback_md
@@ -268,10 +335,11 @@ def convert_pdf(
             lane=lane,
             produced_by=props["produced_by"],
         )
-        full = compose(md_text, meta, options, overrides=options.frontmatter_overrides)
+        header, body = compose_parts(
+            md_text, meta, options, overrides=options.frontmatter_overrides
+        )
 
-        output_dir.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, full)
+        atomic_write_text(out_path, header, body)
         suffix = f", {len(warnings)} warning(s)" if warnings else ""
         if not is_quiet():
             print(f"  OK: {out_name} ({page_count} pages, via {extracted_via}{suffix})")
@@ -9,24 +9,56 @@ from pathlib import Path
 
 from any2md import pipeline
 from any2md.converters import add_warnings, is_quiet
-from any2md.frontmatter import SourceMeta, compose
+from any2md.frontmatter import SourceMeta, compose_parts
 from any2md.pipeline import PipelineOptions
-from any2md.utils import atomic_write_text, read_text_with_fallback, sanitize_filename
+from any2md.utils import (
+    atomic_write_text,
+    count_words,
+    read_text_with_fallback,
+    sanitize_filename,
+)
 
 # Existing structurize() heuristic stays in this file from v0.7 — keep it.
-_SEPARATOR_RE = re.compile(r"^([=\-*_~])\1{2,}\s*$")
-_BULLET_RE = re.compile(r"^[•–·]\s+(.*)$")
-_NUMBERED_RE = re.compile(r"^\(?\d{1,3}[.)]\)?\s+(.*)$")
-_LETTERED_RE = re.compile(r"^\(?[a-z][.)]\)?\s+(.*)$")
-_INDENT_RE = re.compile(r"^(?:    |\t)(.*)$")
-_ALL_CAPS_RE = re.compile(r"^[A-Z][A-Z0-9 /&,:\-]{2,78}$")
-
-
-def _is_title_case(line: str) -> bool:
-    words = line.split()
-    if len(words) < 2:
-        return False
-    skip = {
+# Every line is classified in one MULTILINE finditer over the whole text;
+# ``m.lastgroup`` is the line's kind. Alternatives keep the v0.7 cascade
+# order — separator, indented code, bullet, numbered, lettered, all-caps —
+# and each matches exactly what the old per-line regex matched on the
+# stripped line. ``[^\S\n]`` keeps whitespace from crossing a line break,
+# and ``(?<=\S)`` pins the match end to the last non-blank character so
+# trailing spaces cannot satisfy ``\s+`` or the caps class. ``blank`` and
+# ``other`` catch the rest, so there is exactly one match per line.
+_LINE_RE = re.compile(
+    r"^(?:"
+    r"[^\S\n]*(?P<sep>(?P<sep_char>[=\-*_~])(?P=sep_char){2,})[^\S\n]*"
+    r"|(?P<indent>(?:    |\t)[^\S\n]*\S.*)"
+    r"|[^\S\n]*(?:"
+    r"(?P<bullet>[•–·][^\S\n]+(?P<bullet_text>.*?))"
+    r"|(?P<num>\(?\d{1,3}[.)]\)?[^\S\n]+(?P<num_text>.*?))"
+    r"|(?P<let>\(?[a-z][.)]\)?[^\S\n]+(?P<let_text>.*?))"
+    r"|(?P<caps>[A-Z][A-Z0-9 /&,:\-]{2,78})"
+    r")(?<=\S)[^\S\n]*"
+    r"|(?P<blank>[^\S\n]*)"
+    r"|(?P<other>.*)"
+    r")$",
+    re.MULTILINE,
+)
+# Indentation is judged on the raw line; the code-block scan tests it
+# directly since an indented separator still continues a block.
+_INDENT_PREFIXES = ("    ", "\t")
+
+
+def _classify_lines(text: str) -> list[re.Match[str]]:
+    """One match per ``\n``-separated line of ``text``, in order."""
+    return list(_LINE_RE.finditer(text))
+
+
+def _dedent(line: str) -> str:
+    return line[4:] if line.startswith("    ") else line[1:]
+
+
+# Minor words that don't count against a Title Case line.
+_TITLE_SKIP_WORDS = frozenset(
+    {
         "a",
         "an",
         "the",
@@ -44,7 +76,17 @@ def _is_title_case(line: str) -> bool:
         "from",
         "is",
     }
-    caps = sum(1 for w in words if w[0].isupper() or w.lower() in skip)
+)
+
+
+def _is_title_case(line: str) -> bool:
+    words = line.split()
+    if len(words) < 2:
+        return False
+    caps = 0
+    for w in words:
+        if w[0].isupper() or w.lower() in _TITLE_SKIP_WORDS:
+            caps += 1
     return caps >= len(words) * 0.7
 
 
@@ -55,6 +97,8 @@ def structurize(text: str) -> str:
     """
     text = text.replace("\t", "    ")
     lines = text.split("\n")
+    matches = _classify_lines(text)
+    kinds = [m.lastgroup for m in matches]
     output: list[str] = []
     i = 0
     title_emitted = False
@@ -62,14 +106,30 @@ def structurize(text: str) -> str:
 
     while i < n:
         line = lines[i]
-        stripped = line.strip()
-        prev_stripped = lines[i - 1].strip() if i > 0 else ""
-        next_stripped = lines[i + 1].strip() if i < n - 1 else ""
-
-        sep_match = _SEPARATOR_RE.match(stripped)
-        if sep_match and stripped:
-            char = sep_match.group(1)
-            if prev_stripped and output and output[-1].strip():
+        kind = kinds[i]
+        next_blank = i == n - 1 or kinds[i + 1] == "blank"
+
+        # Plain and blank lines are the bulk of any text file and never
+        # need their match groups, so they take the short path.
+        if kind == "other" or kind == "blank":
+            if kind == "other" and next_blank and i > 0 and kinds[i - 1] == "blank":
+                stripped = line.strip()
+                if (
+                    3 <= len(stripped) <= 80
+                    and _is_title_case(stripped)
+                    and not stripped.endswith((".", "!", "?", ",", ";", ":"))
+                ):
+                    output.append("### " + stripped)
+                    i += 1
+                    continue
+            output.append(line)
+            i += 1
+            continue
+
+        m = matches[i]
+        if kind == "sep":
+            char = m.group("sep_char")
+            if i > 0 and kinds[i - 1] != "blank" and output and output[-1].strip():
                 prev_text = output[-1].strip()
                 if not prev_text.startswith("#"):
                     if char == "=":
@@ -82,63 +142,45 @@ def structurize(text: str) -> str:
             i += 1
             continue
 
-        if _INDENT_RE.match(line) and stripped:
+        if kind == "indent":
             block_lines: list[str] = []
-            while i < n and (_INDENT_RE.match(lines[i]) or not lines[i].strip()):
-                if not lines[i].strip():
+            while i < n and (
+                kinds[i] == "blank" or lines[i].startswith(_INDENT_PREFIXES)
+            ):
+                if kinds[i] == "blank":
                     j = i + 1
-                    while j < n and not lines[j].strip():
+                    while j < n and kinds[j] == "blank":
                         j += 1
-                    if j < n and _INDENT_RE.match(lines[j]):
+                    if j < n and lines[j].startswith(_INDENT_PREFIXES):
                         block_lines.append("")
                         i += 1
                         continue
                     else:
                         break
-                indent_m = _INDENT_RE.match(lines[i])
-                block_lines.append(indent_m.group(1) if indent_m else lines[i])
+                block_lines.append(_dedent(lines[i]))
                 i += 1
             output.append("```")
             output.extend(block_lines)
             output.append("```")
             continue
 
-        bullet_m = _BULLET_RE.match(stripped)
-        if bullet_m:
-            output.append("- " + bullet_m.group(1))
+        if kind == "bullet":
+            output.append("- " + m.group("bullet_text"))
             i += 1
             continue
 
-        num_m = _NUMBERED_RE.match(stripped)
-        let_m = _LETTERED_RE.match(stripped) if not num_m else None
-        if num_m:
-            output.append("1. " + num_m.group(1))
-            i += 1
-            continue
-        if let_m:
-            output.append("1. " + let_m.group(1))
+        if kind in ("num", "let"):
+            output.append("1. " + m.group(kind + "_text"))
             i += 1
             continue
 
-        if _ALL_CAPS_RE.match(stripped) and len(stripped) <= 80:
-            if not next_stripped or i == n - 1:
-                if not title_emitted:
-                    output.append("# " + stripped.title())
-                    title_emitted = True
-                else:
-                    output.append("## " + stripped.title())
-                i += 1
-                continue
-
-        if (
-            3 <= len(stripped) <= 80
-            and not prev_stripped
-            and not next_stripped
-            and _is_title_case(stripped)
-            and not stripped.endswith((".", "!", "?", ",", ";", ":"))
-            and i > 0
-        ):
-            output.append("### " + stripped)
+        if kind == "caps" and next_blank:
+            heading = m.group("caps").title()
+            if not title_emitted:
+                output.append("# " + heading)
+                title_emitted = True
+            else:
+                output.append("## " + heading)
             i += 1
             continue
 
@@ -160,7 +202,7 @@ def _build_meta(txt_path: Path, body: str) -> SourceMeta:
         ),
         keywords=[],
         pages=None,
-        word_count=len(body.split()),
+        word_count=count_words(body),
         source_file=txt_path.name,
         source_url=None,
         doc_type="txt",
@@ -175,6 +217,7 @@ def convert_txt(
     options: PipelineOptions | None = None,
     force: bool = False,
     strip_links_flag: bool = False,
+    skip_existence_check: bool = False,
 ) -> bool:
     """Convert a plain-text file to v1.0 SSRM-compatible Markdown."""
     if options is None:
@@ -182,7 +225,7 @@ def convert_txt(
 
     out_name = sanitize_filename(txt_path.name)
     out_path = output_dir / out_name
-    if out_path.exists() and not force:
+    if not (force or skip_existence_check) and out_path.exists():
         print(f"  SKIP (exists): {out_name}")
         return True
 
@@ -196,10 +239,11 @@ def convert_txt(
         md_text, warnings = pipeline.run(md_text, "text", options)
         add_warnings(warnings)
         meta = _build_meta(txt_path, md_text)
-        full = compose(md_text, meta, options, overrides=options.frontmatter_overrides)
+        header, body = compose_parts(
+            md_text, meta, options, overrides=options.frontmatter_overrides
+        )
 
-        output_dir.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, full)
+        atomic_write_text(out_path, header, body)
         word_count = meta.word_count or 0
         suffix = f", {len(warnings)} warning(s)" if warnings else ""
         if not is_quiet():
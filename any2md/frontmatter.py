@@ -102,6 +102,7 @@ class SourceMeta:
         "docling",
         "pymupdf4llm",
         "mammoth+markdownify",
+        "docx_stream",
         "trafilatura",
         "trafilatura+bs4_fallback",
         "heuristic",
@@ -137,6 +138,7 @@ def recommend_chunk_level(body: str) -> str:
 
 _H1_LINE_RE = re.compile(r"^#\s+\S.*$", re.MULTILINE)
 _HEADING_LINE_RE = re.compile(r"^#{1,6}\s+\S")
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
 
 
 def extract_abstract(body: str) -> str | None:
@@ -150,7 +152,7 @@ def extract_abstract(body: str) -> str | None:
 
     # Walk paragraphs after the H1 (split on blank lines).
     after = body[h1.end() :]
-    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", after)]
+    paragraphs = [p.strip() for p in _PARA_SPLIT_RE.split(after)]
     for para in paragraphs:
         if not para:
             continue
@@ -171,11 +173,22 @@ def extract_abstract(body: str) -> str | None:
 
 _FIRST_H1_RE = re.compile(r"^#\s+(.+?)\s*$", re.MULTILINE)
 _MD_EMPHASIS_RE = re.compile(r"[*_]+")
+# The H1 is nearly always near the top; search this much before the body.
+_TITLE_WINDOW = 4096
+
+
+def _first_h1(body: str) -> re.Match[str] | None:
+    head = body[:_TITLE_WINDOW]
+    m = _FIRST_H1_RE.search(head)
+    # A match running to the window edge may be a truncated heading line.
+    if m is None or (m.end() == len(head) and len(head) < len(body)):
+        m = _FIRST_H1_RE.search(body)
+    return m
 
 
 def derive_title(body: str, title_hint: str | None, fallback: str) -> str:
     """Pick title: first H1, else hint, else cleaned filename stem."""
-    m = _FIRST_H1_RE.search(body)
+    m = _first_h1(body)
     if m:
         title = _MD_EMPHASIS_RE.sub("", m.group(1)).strip()
         if title:
@@ -187,6 +200,15 @@ def derive_title(body: str, title_hint: str | None, fallback: str) -> str:
 
 
 def _yaml_escape(value: str) -> str:
+    # Most titles and sources contain nothing to escape; four substring
+    # probes cost less than four copying replaces.
+    if (
+        "\\" not in value
+        and '"' not in value
+        and "\n" not in value
+        and "\r" not in value
+    ):
+        return value
     return (
         value.replace("\\", "\\\\")
         .replace('"', '\\"')
@@ -217,7 +239,8 @@ def _emit_array(values: list[str]) -> str:
 
 def _normalize_body(body: str) -> str:
     """Normalize body to NFC + LF endings, ensuring trailing newline."""
-    body = body.replace("\r\n", "\n").replace("\r", "\n")
+    if "\r" in body:
+        body = body.replace("\r\n", "\n").replace("\r", "\n")
     body = unicodedata.normalize("NFC", body)
     if not body.endswith("\n"):
         body += "\n"
@@ -325,32 +348,27 @@ def _deep_merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, An
     return out
 
 
-def _emit_field(key: str, value: Any, lines: list[str]) -> None:
-    """Emit one ``key: value`` line (or block) into ``lines``."""
+def _emit_field(key: str, value: Any) -> str:
+    """Emit one ``key: value`` line (or block, newline-joined)."""
     if isinstance(value, dict):
-        lines.append(f"{key}:")
-        for subkey, subval in value.items():
-            lines.append(f"  {subkey}: {_emit_value(subval)}")
-        return
+        return "\n".join(
+            [f"{key}:"]
+            + [f"  {subkey}: {_emit_value(subval)}" for subkey, subval in value.items()]
+        )
     if isinstance(value, list):
         # Only string-lists are supported for now (matches SSRM §3 fields).
-        lines.append(f"{key}: {_emit_array([str(v) for v in value])}")
-        return
+        return f"{key}: {_emit_array([str(v) for v in value])}"
     if isinstance(value, (int, float)) and not isinstance(value, bool):
-        lines.append(f"{key}: {value}")
-        return
+        return f"{key}: {value}"
     # Default: scalar/string emission.
-    lines.append(f"{key}: {_emit_value(value)}")
+    return f"{key}: {_emit_value(value)}"
 
 
-def _emit_yaml_with_body(fields: dict[str, Any], body: str) -> str:
-    """Serialize ``fields`` as YAML frontmatter and concatenate ``body``."""
-    lines: list[str] = ["---"]
-    for key, value in fields.items():
-        _emit_field(key, value, lines)
-    lines.append("---")
-    lines.append("")  # blank line separator
-    return "\n".join(lines) + "\n" + body
+def _emit_yaml(fields: dict[str, Any]) -> str:
+    """Serialize ``fields`` as a YAML frontmatter block, separator included."""
+    # The trailing "" pair yields the closing newline and blank separator line.
+    lines = ["---", *[_emit_field(k, v) for k, v in fields.items()], "---", "", ""]
+    return "\n".join(lines)
 
 
 def compose(
@@ -368,9 +386,25 @@ def compose(
        ``.any2md.toml``) over the derived field map.
     4. Emit YAML frontmatter in spec §3.2-3.4 order and concatenate the body.
     """
+    header, body = compose_parts(body, meta, options, overrides)
+    return header + body
+
+
+def compose_parts(
+    body: str,
+    meta: SourceMeta,
+    options: PipelineOptions,
+    overrides: dict[str, Any] | None = None,
+) -> tuple[str, str]:
+    """Like ``compose`` but return ``(frontmatter, normalized_body)``.
+
+    ``"".join(compose_parts(...)) == compose(...)``. Converters hand the
+    two parts straight to ``atomic_write_text`` so a multi-MB body is
+    never copied into a concatenated document string.
+    """
     body = _normalize_body(body)
     overrides = filter_reserved_overrides(overrides, source_label="compose()")
     fields = _build_fields(body, meta, options)
     if overrides:
         fields = _deep_merge(fields, overrides)
-    return _emit_yaml_with_body(fields, body)
+    return _emit_yaml(fields), body
@@ -119,6 +119,15 @@ _ACADEMIC_BYLINE_RE = re.compile(
     r"(?:\s*,\s*[A-Z][A-Z .'\-]{2,}(?:\s+\d+(?:\s*,\s*\d+)*)?)+\s*$",
 )
 
+_WS_RUN_RE = re.compile(r"\s+")
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
+_AND_SEP_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+# arxiv ID in a filename basename: trailing first, then anywhere.
+_ARXIV_ID_TRAILING_RE = re.compile(r"(?<![0-9.])(\d{4}\.\d{4,5})(?:v\d+)?$")
+_ARXIV_ID_ANYWHERE_RE = re.compile(r"(?<![0-9.])(\d{4}\.\d{4,5})(?:v\d+)?(?![0-9.])")
+
 # arxiv ID pattern in filename
 _ARXIV_FILENAME_RE = re.compile(
     r"(?<!\d)(\d{4}\.\d{4,5})(?:v\d+)?(?=\.pdf$|\.|$)",
@@ -259,7 +268,7 @@ def _cleanup_abstract(text: str) -> str:
     # Decode HTML entities
     text = html.unescape(text)
     # Collapse whitespace runs
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RUN_RE.sub(" ", text).strip()
     # Truncate to <= 400 chars at last sentence boundary
     if len(text) > 400:
         head = text[:400]
@@ -277,7 +286,7 @@ def _cleanup_abstract(text: str) -> str:
 def _split_body_paragraphs(body: str) -> list[str]:
     """Split body into paragraphs (blank-line separated, headings excluded)."""
     paras: list[str] = []
-    for chunk in re.split(r"\n\s*\n", body):
+    for chunk in _PARA_SPLIT_RE.split(body):
         line = chunk.strip()
         if not line:
             continue
@@ -358,7 +367,7 @@ def _normalize_author_name(name: str) -> str:
     """Title-case a name and strip stray digits/whitespace."""
     # Strip affiliation digits (trailing or interleaved)
     cleaned = _AFFIL_DIGITS_RE.sub("", name)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" ,.")
+    cleaned = _WS_RUN_RE.sub(" ", cleaned).strip(" ,.")
     if not cleaned:
         return ""
     # Title-case if currently all-caps; else preserve.
@@ -370,7 +379,7 @@ def _normalize_author_name(name: str) -> str:
 def _split_authors(text: str) -> list[str]:
     """Split a comma/and-separated author list into individual names."""
     # Replace " and " with comma to unify separators
-    text = re.sub(r"\s+and\s+", ", ", text, flags=re.IGNORECASE)
+    text = _AND_SEP_RE.sub(", ", text)
     parts = [p.strip() for p in text.split(",")]
     # Filter empties and pure-digit affiliation tokens
     return [p for p in parts if p and not p.strip().isdigit()]
@@ -381,8 +390,8 @@ def _dedupe_authors(authors: list[str]) -> list[str]:
     seen: set[str] = set()
     out: list[str] = []
     for a in authors:
-        key = re.sub(r"\s+", " ", a.strip().lower())
-        key = re.sub(r"[^\w\s]", "", key)
+        key = _WS_RUN_RE.sub(" ", a.strip().lower())
+        key = _NON_WORD_RE.sub("", key)
         if not key or key in seen:
             continue
         seen.add(key)
@@ -499,12 +508,12 @@ def is_arxiv_filename(name: str) -> str | None:
     # ("AI_Governance_through_Markets-2501.17755v1.pdf"), or trailing.
     # The negative-lookbehind (?<![0-9.]) prevents matching a number
     # embedded in a longer numeric sequence.
-    m = re.search(r"(?<![0-9.])(\d{4}\.\d{4,5})(?:v\d+)?$", base_no_ext)
+    m = _ARXIV_ID_TRAILING_RE.search(base_no_ext)
     if m:
         return m.group(1)
     # Also accept the arxiv ID anywhere in the basename when followed by
     # a non-digit/non-dot or end-of-string.
-    m = re.search(r"(?<![0-9.])(\d{4}\.\d{4,5})(?:v\d+)?(?![0-9.])", base_no_ext)
+    m = _ARXIV_ID_ANYWHERE_RE.search(base_no_ext)
     if m:
         return m.group(1)
     return None
@@ -65,17 +65,54 @@ def normalize_quotes_dashes(text: str, _options: "PipelineOptions") -> str:
     return text
 
 
-_INTERWORD_RUNS_RE = re.compile(r"(?<=\S)[ \t]{2,}(?=\S)")
-_TRAILING_WS_RE = re.compile(r"[ \t]+$", re.MULTILINE)
-_BLANK_RUN_RE = re.compile(r"\n{3,}")
-
-
-def collapse_whitespace(text: str, _options: "PipelineOptions") -> str:
-    """C5: Collapse inter-word whitespace; trim trailing per line; cap blanks at 2."""
-    text = _INTERWORD_RUNS_RE.sub(" ", text)
-    text = _TRAILING_WS_RE.sub("", text)
-    text = _BLANK_RUN_RE.sub("\n\n", text)
-    return text
+# C5 runs as one scan. Each alternative is one of the old sequential
+# substitutions (inter-word runs, trailing whitespace, blank-line runs —
+# lines holding only spaces/tabs count as blank, as they would once
+# trailing whitespace is gone); they never overlap, so one pass equals
+# the three in sequence. Every alternative shares the leading character
+# class and checks its own context with a lookbehind, which lets the
+# regex engine skip straight to candidate characters. When
+# ``strip_links`` is set the inline-link alternative joins the same scan;
+# ``(?<!!\[)`` leaves image embeds alone.
+_WS_ALTS = (
+    r"(?<=\S[ \t])(?P<interword>[ \t]+)(?=\S)"
+    r"|(?<=[ \t])(?P<trailing>[ \t]*)$"
+    r"|(?<=\n)(?P<blank_run>(?:[ \t]*\n){2,})"
+)
+_LINK_ALT = r"|(?<=\[)(?<!!\[)(?P<link_text>[^\]]+)\]\([^)]+\)"
+_COLLAPSE_RES = {
+    False: re.compile(rf"[ \t\n](?:{_WS_ALTS})", re.MULTILINE),
+    True: re.compile(rf"[ \t\n\[](?:{_WS_ALTS}{_LINK_ALT})", re.MULTILINE),
+}
+_WS_REPLACEMENTS = {"interword": " ", "trailing": "", "blank_run": "\n\n"}
+# Every whitespace match contains one of these substrings (or sits on a
+# trailing space at end of text); a link match always contains "](".
+_WS_PROBES = ("  ", "\t", " \n", "\n\n\n")
+
+
+def _collapse_repl(m: re.Match[str]) -> str:
+    kind = m.lastgroup
+    if kind == "link_text":
+        # Link text gets the same whitespace treatment as the body.
+        return _COLLAPSE_RES[False].sub(_collapse_repl, m.group(kind))
+    return _WS_REPLACEMENTS[kind]
+
+
+def collapse_whitespace(text: str, options: "PipelineOptions") -> str:
+    """C5: Collapse inter-word whitespace; trim trailing per line; cap blanks at 2.
+
+    With ``options.strip_links`` (``--strip-links`` / ``--profile
+    maximum``), also replaces ``[text](url)`` with ``text`` in the same pass.
+    Text with nothing to collapse — the usual case for pymupdf4llm output —
+    is returned after a few substring probes, without a regex scan.
+    """
+    if not (
+        any(probe in text for probe in _WS_PROBES)
+        or text.endswith(" ")
+        or (options.strip_links and "](" in text)
+    ):
+        return text
+    return _COLLAPSE_RES[options.strip_links].sub(_collapse_repl, text)
 
 
 _FENCE_RE = re.compile(r"^```")
@@ -21,6 +21,7 @@ _HTML_FIGURE_RE = re.compile(
     re.DOTALL | re.IGNORECASE,
 )
 _IMAGE_PLACEHOLDER_RE = re.compile(r"<!--\s*image\s*-->", re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
 
 
 def lift_figure_captions(text: str, options: "PipelineOptions") -> str:
@@ -45,7 +46,7 @@ def lift_figure_captions(text: str, options: "PipelineOptions") -> str:
     text = _IMG_LINK_RE.sub(_img_repl, text)
 
     def _figure_repl(match: re.Match[str]) -> str:
-        cap = re.sub(r"<[^>]+>", "", match.group(1)).strip()
+        cap = _HTML_TAG_RE.sub("", match.group(1)).strip()
         return f"*Figure: {cap}*" if cap else ""
 
     text = _HTML_FIGURE_RE.sub(_figure_repl, text)
@@ -62,6 +63,7 @@ STAGES: list[Stage] = [
 
 _TABLE_ROW_RE = re.compile(r"^\|.*\|\s*$")
 _ALIGNMENT_ROW_RE = re.compile(r"^\|[\s:|-]+\|\s*$")
+_SPACE_RUN_RE = re.compile(r"  +")
 
 
 def compact_tables(text: str, _options: "PipelineOptions") -> str:
@@ -77,7 +79,7 @@ def compact_tables(text: str, _options: "PipelineOptions") -> str:
             # Reconstruct without padding
             line = "|" + "|".join(c if c == "" else f" {c} " for c in cells[1:-1]) + "|"
             # Compact spaces inside each cell wrapper to single
-            line = re.sub(r"  +", " ", line)
+            line = _SPACE_RUN_RE.sub(" ", line)
         out.append(line)
     return "\n".join(out)
 
@@ -82,6 +82,7 @@ def repair_line_wraps(text: str, _options: "PipelineOptions") -> str:
 
 
 _HYPHEN_WRAP_RE = re.compile(r"([a-z]+)-\n([a-z]+)")
+_LOWER_WORD_RE = re.compile(r"\b[a-z]+\b")
 
 
 def dehyphenate(text: str, _options: "PipelineOptions") -> str:
@@ -91,13 +92,16 @@ def dehyphenate(text: str, _options: "PipelineOptions") -> str:
     (same-doc corroboration). Avoids breaking compound words like
     'co-pilot' that appear hyphenated genuinely.
     """
+    # Every candidate contains "-\n"; most extractor output has none.
+    if "-\n" not in text:
+        return text
     # Find candidates first
     candidates = list(_HYPHEN_WRAP_RE.finditer(text))
     if not candidates:
         return text
 
     # Build set of words that appear in the text (lowercase, alphanumeric)
-    words_in_doc = set(re.findall(r"\b[a-z]+\b", text.lower()))
+    words_in_doc = set(_LOWER_WORD_RE.findall(text.lower()))
 
     def _replace(match: re.Match[str]) -> str:
         prefix_word = match.group(1)
@@ -117,12 +121,17 @@ _AUTHOR_CONTACT_RE = re.compile(
     re.IGNORECASE,
 )
 _CONTACT_EMAIL_RE = re.compile(r"^Contact:.*@.*\..*$", re.IGNORECASE)
+# Both byline patterns contain "contact"; one search of the whole text
+# is far cheaper than splitting and matching every line.
+_CONTACT_PROBE_RE = re.compile(r"contact", re.IGNORECASE)
 
 
 def strip_repeated_byline(text: str, options: "PipelineOptions") -> str:
     """T9: Remove 'Author's Contact Information:' duplicate-byline lines."""
     if options.profile not in ("aggressive", "maximum"):
         return text
+    if not _CONTACT_PROBE_RE.search(text):
+        return text
     lines = text.split("\n")
     out: list[str] = []
     for i, line in enumerate(lines):
@@ -5,6 +5,8 @@ import sys
 
 import yaml
 
+from any2md.cli import _folds_case
+
 
 def _run(*args, cwd=None):
     return subprocess.run(
@@ -50,3 +52,120 @@ def test_strip_links_propagates_to_pipeline_options(fixture_dir, tmp_output_dir)
     end = text.index("\n---\n", 4)
     fm = yaml.safe_load(text[4:end])
     assert fm["status"] == "draft"
+
+
+def test_input_dir_scan_filters_by_extension(tmp_path, tmp_output_dir):
+    src = tmp_path / "in"
+    src.mkdir()
+    (src / "bravo.txt").write_text("Bravo body text.\n", encoding="utf-8")
+    (src / "ALPHA.TXT").write_text("Alpha body text.\n", encoding="utf-8")
+    (src / "notes.md").write_text("not an input\n", encoding="utf-8")
+    (src / "dir.txt").mkdir()  # directory with a supported suffix
+    r = _run("-o", str(tmp_output_dir), "--input-dir", str(src))
+    assert r.returncode == 0, r.stderr
+    assert "Processing 2 file(s)" in r.stdout
+    assert sorted(p.name for p in tmp_output_dir.glob("*.md")) == [
+        "ALPHA.md",
+        "bravo.md",
+    ]
+
+
+def test_recursive_scan_walks_subdirectories(tmp_path, tmp_output_dir):
+    src = tmp_path / "in"
+    (src / "sub" / "deeper").mkdir(parents=True)
+    (src / "top.txt").write_text("Top body text.\n", encoding="utf-8")
+    (src / "sub" / "MID.TXT").write_text("Mid body text.\n", encoding="utf-8")
+    (src / "sub" / "deeper" / "low.txt").write_text("Low.\n", encoding="utf-8")
+    (src / "sub" / "notes.md").write_text("not an input\n", encoding="utf-8")
+    (src / "sub" / "dir.txt").mkdir()  # directory with a supported suffix
+    r = _run("-o", str(tmp_output_dir), "--recursive", "--input-dir", str(src))
+    assert r.returncode == 0, r.stderr
+    assert "Processing 3 file(s)" in r.stdout
+    assert sorted(p.name for p in tmp_output_dir.glob("*.md")) == [
+        "MID.md",
+        "low.md",
+        "top.md",
+    ]
+
+
+def test_recursive_scan_survives_symlink_cycle(tmp_path, tmp_output_dir):
+    src = tmp_path / "in"
+    (src / "sub").mkdir(parents=True)
+    (src / "sub" / "a.txt").write_text("Body text.\n", encoding="utf-8")
+    (src / "sub" / "loop").symlink_to("..", target_is_directory=True)
+    r = _run("-o", str(tmp_output_dir), "--recursive", "--input-dir", str(src))
+    assert r.returncode == 0, r.stderr
+    assert "Processing 1 file(s)" in r.stdout
+    assert [p.name for p in tmp_output_dir.glob("*.md")] == ["a.md"]
+
+
+def test_recursive_scan_skips_symlinked_directory(tmp_path, tmp_output_dir):
+    src = tmp_path / "in"
+    (src / "real").mkdir(parents=True)
+    (src / "real" / "a.txt").write_text("Body text.\n", encoding="utf-8")
+    (src / "alias").symlink_to("real", target_is_directory=True)
+    r = _run("-o", str(tmp_output_dir), "--recursive", "--input-dir", str(src))
+    assert r.returncode == 0, r.stderr
+    assert "Processing 1 file(s)" in r.stdout
+    assert "SKIP (exists)" not in r.stdout
+
+
+def test_duplicate_output_name_in_one_run_is_skipped(tmp_path, tmp_output_dir):
+    first = tmp_path / "a"
+    second = tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    (first / "notes.txt").write_text("First body text.\n", encoding="utf-8")
+    (second / "notes.txt").write_text("Second body text.\n", encoding="utf-8")
+    r = _run("-o", str(tmp_output_dir), str(first), str(second))
+    assert r.returncode == 0, r.stderr
+    assert "SKIP (exists): notes.md" in r.stdout
+    assert "First body text." in (tmp_output_dir / "notes.md").read_text()
+    r = _run("-o", str(tmp_output_dir), "--force", str(first), str(second))
+    assert r.returncode == 0, r.stderr
+    assert "Second body text." in (tmp_output_dir / "notes.md").read_text()
+
+
+def test_case_only_match_with_existing_output(tmp_path, tmp_output_dir):
+    (tmp_output_dir / "Report.md").write_text("keep me\n", encoding="utf-8")
+    (tmp_path / "report.txt").write_text("Body text.\n", encoding="utf-8")
+    r = _run("-o", str(tmp_output_dir), str(tmp_path / "report.txt"))
+    assert r.returncode == 0, r.stderr
+    if _folds_case(tmp_output_dir):
+        assert "SKIP (exists): report.md" in r.stdout
+    else:
+        assert "SKIP" not in r.stdout
+        assert "Body text." in (tmp_output_dir / "report.md").read_text()
+    assert (tmp_output_dir / "Report.md").read_text() == "keep me\n"
+
+
+def test_case_only_match_between_inputs(tmp_path, tmp_output_dir):
+    (tmp_path / "NOTES.txt").write_text("First body.\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("Second body.\n", encoding="utf-8")
+    r = _run(
+        "-o",
+        str(tmp_output_dir),
+        str(tmp_path / "NOTES.txt"),
+        str(tmp_path / "notes.txt"),
+    )
+    assert r.returncode == 0, r.stderr
+    assert "First body." in (tmp_output_dir / "NOTES.md").read_text()
+    if _folds_case(tmp_output_dir):
+        assert "SKIP (exists): notes.md" in r.stdout
+    else:
+        assert "SKIP" not in r.stdout
+        assert "Second body." in (tmp_output_dir / "notes.md").read_text()
+
+
+def test_max_file_size_uses_scanned_size(tmp_path, tmp_output_dir):
+    src = tmp_path / "in"
+    src.mkdir()
+    (src / "small.txt").write_text("Tiny.\n", encoding="utf-8")
+    (src / "large.txt").write_text("Larger body text. " * 20, encoding="utf-8")
+    loose = tmp_path / "loose.txt"
+    loose.write_text("Larger body text. " * 20, encoding="utf-8")
+    r = _run("-o", str(tmp_output_dir), "--max-file-size", "100", str(src), str(loose))
+    assert r.returncode == 0, r.stderr
+    assert "SKIP (too large): large.txt" in r.stderr
+    assert "SKIP (too large): loose.txt" in r.stderr
+    assert [p.name for p in tmp_output_dir.glob("*.md")] == ["small.md"]
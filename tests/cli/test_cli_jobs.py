@@ -0,0 +1,72 @@
+"""CLI behavior for --jobs (parallel worker-process conversion)."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, "-m", "any2md", *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_jobs_in_help():
+    r = _run("--help")
+    assert r.returncode == 0
+    assert "--jobs" in r.stdout
+
+
+def test_jobs_rejects_negative(fixture_dir):
+    r = _run("--jobs", "-1", str(fixture_dir / "ligatures_and_softhyphens.txt"))
+    assert r.returncode == 2
+    assert "--jobs must be >= 0" in r.stderr
+
+
+def test_jobs_converts_batch_in_submission_order(fixture_dir, tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    names = ["alpha.txt", "bravo.txt", "charlie.txt"]
+    for name in names:
+        shutil.copy(fixture_dir / "ligatures_and_softhyphens.txt", src / name)
+    out = tmp_path / "out"
+    r = _run("-j", "2", "-o", str(out), *(str(src / n) for n in names))
+    assert r.returncode == 0, f"stdout={r.stdout!r} stderr={r.stderr!r}"
+    assert sorted(p.name for p in out.glob("*.md")) == [
+        "alpha.md",
+        "bravo.md",
+        "charlie.md",
+    ]
+    ok_lines = [ln for ln in r.stdout.splitlines() if "OK:" in ln]
+    assert [ln.split()[1] for ln in ok_lines] == ["alpha.md", "bravo.md", "charlie.md"]
+    assert "3 converted" in r.stdout
+
+
+def test_jobs_quiet_propagates_to_workers(fixture_dir, tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ("one.txt", "two.txt"):
+        shutil.copy(fixture_dir / "ligatures_and_softhyphens.txt", src / name)
+    out = tmp_path / "out"
+    r = _run("-q", "-j", "2", "-o", str(out), str(src))
+    assert r.returncode == 0, f"stdout={r.stdout!r} stderr={r.stderr!r}"
+    assert "OK:" not in r.stdout
+    assert len(list(out.glob("*.md"))) == 2
+
+
+def test_jobs_forwards_worker_warnings_for_strict(tmp_path):
+    """Pipeline warnings raised in workers still drive --strict exit 3."""
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ("one.txt", "two.txt"):
+        # No heading at all → validator emits an H1-count warning.
+        (src / name).write_text("just a plain sentence of text.\n", encoding="utf-8")
+    out = tmp_path / "out"
+    r = _run("--strict", "-j", "2", "-o", str(out), str(src))
+    assert r.returncode == 3, f"stdout={r.stdout!r} stderr={r.stderr!r}"
+    assert "2 warning(s)" in r.stdout
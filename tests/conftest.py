@@ -4,6 +4,8 @@ from pathlib import Path
 
 import pytest
 
+from any2md import _http
+
 
 @pytest.fixture
 def fixture_dir() -> Path:
@@ -23,3 +25,11 @@ def tmp_output_dir(tmp_path) -> Path:
     out = tmp_path / "output"
     out.mkdir()
     return out
+
+
+@pytest.fixture(autouse=True)
+def _clear_host_check_cache():
+    """Tests stub DNS per test; don't let one test's verdict leak into the next."""
+    _http._SAFE_HOSTS.clear()
+    yield
+    _http._SAFE_HOSTS.clear()
@@ -0,0 +1,79 @@
+"""Integration test: streaming DOCX reader used for very large bodies."""
+
+import zipfile
+from pathlib import Path
+
+import yaml
+
+import any2md.converters.docx as docx_mod
+from any2md.converters._docx_stream import docx_to_markdown, iter_docx_blocks
+from any2md.converters.docx import convert_docx
+from any2md.pipeline import PipelineOptions
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+_DOCUMENT = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{_W_NS}">
+  <w:body>
+    <w:p><w:pPr><w:pStyle w:val="Title"/></w:pPr><w:r><w:t>Big Doc</w:t></w:r></w:p>
+    <w:p><w:pPr><w:pStyle w:val="Heading2"/></w:pPr><w:r><w:t>Scope</w:t></w:r></w:p>
+    <w:p><w:r><w:t xml:space="preserve">Split </w:t></w:r><w:r><w:t>runs.</w:t></w:r></w:p>
+    <w:p><w:pPr><w:numPr><w:ilvl w:val="0"/></w:numPr></w:pPr><w:r><w:t>first</w:t></w:r></w:p>
+    <w:p><w:pPr><w:numPr><w:ilvl w:val="1"/></w:numPr></w:pPr><w:r><w:t>nested</w:t></w:r></w:p>
+    <w:p/>
+    <w:tbl>
+      <w:tr><w:tc><w:p><w:r><w:t>H1</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>H2</w:t></w:r></w:p></w:tc></w:tr>
+      <w:tr><w:tc><w:p><w:r><w:t>a|b</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>c</w:t></w:r></w:p></w:tc></w:tr>
+    </w:tbl>
+    <w:p><w:r><w:t>After table.</w:t></w:r></w:p>
+  </w:body>
+</w:document>
+"""
+
+
+def _build(path: Path, document: str = _DOCUMENT) -> Path:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("word/document.xml", document)
+    return path
+
+
+def test_iter_docx_blocks_emits_structure(tmp_path):
+    blocks = list(iter_docx_blocks(_build(tmp_path / "big.docx")))
+    assert blocks == [
+        "# Big Doc",
+        "## Scope",
+        "Split runs.",
+        "- first\n  - nested",
+        "| H1 | H2 |\n| --- | --- |\n| a\\|b | c |",
+        "After table.",
+    ]
+
+
+def test_stream_reader_does_not_expand_entities(tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("TOP SECRET", encoding="utf-8")
+    doc = (
+        f'<?xml version="1.0"?><!DOCTYPE d [<!ENTITY x SYSTEM "file://{secret}">]>'
+        f'<w:document xmlns:w="{_W_NS}"><w:body>'
+        "<w:p><w:r><w:t>&x;</w:t></w:r></w:p></w:body></w:document>"
+    )
+    assert "TOP SECRET" not in docx_to_markdown(_build(tmp_path / "x.docx", doc))
+
+
+def test_convert_docx_streams_large_body(fixture_dir, tmp_output_dir, monkeypatch):
+    monkeypatch.setattr(docx_mod, "has_docling", lambda: False)
+    monkeypatch.setattr(docx_mod, "_STREAM_MIN_DOCUMENT_BYTES", 0)
+    ok = convert_docx(
+        fixture_dir / "table_heavy.docx",
+        tmp_output_dir,
+        options=PipelineOptions(),
+        force=True,
+    )
+    assert ok
+    out = next(tmp_output_dir.glob("*.md")).read_text(encoding="utf-8")
+    end = out.index("\n---\n", 4)
+    fm = yaml.safe_load(out[4:end])
+    assert fm["extracted_via"] == "docx_stream"
+    assert fm["title"] == "Table Heavy Test Document"
+    body = out[end + 5 :]
+    assert "Header 1" in body and "Cell A" in body
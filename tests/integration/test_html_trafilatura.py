@@ -49,6 +49,12 @@ class _FakeResp:
     def read(self, n: int | None = None) -> bytes:
         return self._buf.read(n) if n is not None else self._buf.read()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        pass
+
 
 def _http_err(code: int, location: str | None = None):
     m = Message()
@@ -103,3 +109,86 @@ def test_fetch_url_rejects_file_scheme(monkeypatch):
 def test_http_last_modified_validates_host(monkeypatch):
     _stub_dns(monkeypatch, {"meta.example": "169.254.169.254"})
     assert html_mod._http_last_modified("http://meta.example/") is None
+
+
+def test_fetch_and_parse_builds_tree_across_chunks(monkeypatch):
+    _stub_dns(monkeypatch, {"public.example": "1.1.1.1"})
+    # "é" is split across the 64 KiB chunk boundary by the padding.
+    pad = "x" * (64 * 1024 - len("<html><body><p>"))
+    page = f"<html><body><p>{pad}é</p><p>tail</p></body></html>".encode()
+    _patch_opener(monkeypatch, _FakeOpener([_FakeResp(page)]))
+    root, err = html_mod.fetch_and_parse("https://public.example/")
+    assert err is None
+    paras = root.findall(".//p")
+    assert paras[0].text.endswith("é")
+    assert paras[1].text == "tail"
+
+
+def test_convert_html_accepts_parsed_tree(fixture_dir, tmp_output_dir):
+    import lxml.html
+
+    raw = (fixture_dir / "web_page.html").read_text(encoding="utf-8")
+    tree = lxml.html.document_fromstring(raw)
+    ok = convert_html(
+        None,
+        tmp_output_dir,
+        options=PipelineOptions(),
+        force=True,
+        source_url="https://public.example/article",
+        html_tree=tree,
+    )
+    assert ok
+    out = next(tmp_output_dir.glob("*.md")).read_text(encoding="utf-8")
+    assert "Sidebar noise" not in out
+    assert "Test Article" in out
+    # trafilatura works on copies; the caller's tree is left intact.
+    assert "Sidebar noise" in lxml.html.tostring(tree, encoding="unicode")
+
+
+def test_local_html_is_parsed_once(fixture_dir, tmp_output_dir, monkeypatch):
+    import lxml.html
+
+    calls = []
+    real_load = html_mod.load_html
+    seen_types = set()
+    real_extract = html_mod.trafilatura.extract
+
+    def counting_load(obj, *a, **kw):
+        calls.append(type(obj))
+        return real_load(obj, *a, **kw)
+
+    def recording_extract(obj, *a, **kw):
+        seen_types.add(type(obj))
+        return real_extract(obj, *a, **kw)
+
+    monkeypatch.setattr(html_mod, "load_html", counting_load)
+    monkeypatch.setattr(html_mod.trafilatura, "extract", recording_extract)
+    ok = convert_html(
+        fixture_dir / "web_page.html",
+        tmp_output_dir,
+        options=PipelineOptions(),
+        force=True,
+    )
+    assert ok
+    assert calls == [str]
+    assert seen_types == {lxml.html.HtmlElement}
+
+
+def test_jobs_worker_and_serial_url_paths_match(fixture_dir, tmp_path, monkeypatch):
+    from any2md.cli import _convert_in_worker
+
+    _stub_dns(monkeypatch, {"public.example": "1.1.1.1"})
+    page = (fixture_dir / "web_page.html").read_bytes()
+    _patch_opener(
+        monkeypatch,
+        _FakeOpener([_FakeResp(page), _http_err(404), _FakeResp(page), _http_err(404)]),
+    )
+    url = "https://public.example/article"
+    serial_dir, worker_dir = tmp_path / "serial", tmp_path / "worker"
+    assert html_mod.convert_url(url, serial_dir, options=PipelineOptions())
+    ok, _warnings, _out, err = _convert_in_worker(
+        url, worker_dir, PipelineOptions(), False
+    )
+    assert ok, err
+    name = "public_example_article.md"
+    assert (worker_dir / name).read_bytes() == (serial_dir / name).read_bytes()
@@ -74,3 +74,88 @@ def test_pdf_software_creator_routes_to_produced_by(
     fm = yaml.safe_load(out[4:end])
     assert fm["organization"] == ""  # empty when software-creator
     assert fm["produced_by"] == "Adobe InDesign 16.2 (Windows)"
+
+
+def test_page_ranges_split_evenly_with_minimum_size():
+    from any2md.converters.pdf import _page_ranges
+
+    assert _page_ranges(100, 1) == []
+    assert _page_ranges(15, 4) == []  # fewer than 2 x 8 pages
+    assert _page_ranges(16, 4) == [(0, 8), (8, 16)]
+    assert _page_ranges(30, 3) == [(0, 10), (10, 20), (20, 30)]
+
+
+def test_page_workers_reproduce_serial_output(tmp_path, monkeypatch):
+    import pymupdf
+
+    from any2md.converters import pdf as pdf_mod
+
+    src = tmp_path / "long.pdf"
+    doc = pymupdf.open()
+    for n in range(16):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Heading {n}", fontsize=18)
+        page.insert_text((72, 110), f"Body text on page {n}. " * 5, fontsize=10)
+    doc.save(str(src))
+    doc.close()
+
+    with pymupdf.open(str(src)) as doc:
+        serial, _ = pdf_mod._extract_via_pymupdf4llm(doc, src)
+    monkeypatch.setattr(pdf_mod, "page_workers", lambda: 2)
+    with pymupdf.open(str(src)) as doc:
+        parallel, via = pdf_mod._extract_via_pymupdf4llm(doc, src)
+    assert via == "pymupdf4llm"
+    assert parallel == serial
+    assert "Body text on page 15." in parallel
+
+
+def test_page_workers_rank_headings_over_whole_document(tmp_path, monkeypatch):
+    import pymupdf
+
+    from any2md.converters import pdf as pdf_mod
+
+    # The first range only carries 24 pt headings and the second only
+    # 16 pt ones; ranked per range, both would come out as "#".
+    src = tmp_path / "mixed.pdf"
+    doc = pymupdf.open()
+    for n in range(16):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Heading {n}", fontsize=24 if n < 8 else 16)
+        page.insert_text((72, 110), f"Body text on page {n}. " * 5, fontsize=10)
+    doc.save(str(src))
+    doc.close()
+
+    with pymupdf.open(str(src)) as doc:
+        serial, _ = pdf_mod._extract_via_pymupdf4llm(doc, src)
+    monkeypatch.setattr(pdf_mod, "page_workers", lambda: 2)
+    with pymupdf.open(str(src)) as doc:
+        parallel, _ = pdf_mod._extract_via_pymupdf4llm(doc, src)
+    assert parallel == serial
+    assert "# Heading 0" in parallel
+    assert "## Heading 15" in parallel
+
+
+def test_layout_mode_renders_serially(tmp_path, monkeypatch):
+    import pymupdf
+
+    from any2md.converters import pdf as pdf_mod
+
+    src = tmp_path / "long.pdf"
+    doc = pymupdf.open()
+    for n in range(16):
+        doc.new_page().insert_text((72, 72), f"Page {n}", fontsize=10)
+    doc.save(str(src))
+    doc.close()
+
+    # Layout mode's pymupdf4llm exposes no IdentifyHeaders.
+    monkeypatch.delattr(pdf_mod.pymupdf4llm, "IdentifyHeaders")
+    monkeypatch.setattr(pdf_mod, "page_workers", lambda: 2)
+
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("layout mode must not split by page range")
+
+    monkeypatch.setattr(pdf_mod, "ProcessPoolExecutor", _no_pool)
+    with pymupdf.open(str(src)) as doc:
+        md, via = pdf_mod._extract_via_pymupdf4llm(doc, src)
+    assert via == "pymupdf4llm"
+    assert "Page 15" in md
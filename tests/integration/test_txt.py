@@ -2,7 +2,7 @@
 
 import yaml
 
-from any2md.converters.txt import convert_txt
+from any2md.converters.txt import _classify_lines, convert_txt, structurize
 from any2md.pipeline import PipelineOptions
 
 
@@ -30,3 +30,65 @@ def test_txt_end_to_end_writes_ssrm_compat_output(fixture_dir, tmp_output_dir):
     assert "­" not in body  # soft hyphen stripped
     assert "ﬁ" not in body  # ligature expanded
     assert "“" not in body  # smart quote normalized
+
+
+def test_structurize_detects_each_line_kind():
+    text = (
+        "Title\n"
+        "=====\n"
+        "• bullet\n"
+        "(2) numbered\n"
+        "b) lettered\n"
+        "    code line\n"
+        "\n"
+        "    more code\n"
+        "\n"
+        "SECTION HEAD\n"
+        "\n"
+        "-----"
+    )
+    assert structurize(text).split("\n") == [
+        "# Title",
+        "- bullet",
+        "1. numbered",
+        "1. lettered",
+        "```",
+        "code line",
+        "",
+        "more code",
+        "```",
+        "",
+        "# Section Head",
+        "",
+        "---",
+    ]
+
+
+def test_classify_lines_yields_one_kind_per_line():
+    text = "• a\n\n  \n•   \nAB  \nABC  \n    x\n    ----\nplain"
+    kinds = [m.lastgroup for m in _classify_lines(text)]
+    assert kinds == [
+        "bullet",
+        "blank",
+        "blank",
+        "other",  # bare bullet char: nothing after the whitespace
+        "other",  # too short for a caps heading once trailing space is dropped
+        "caps",
+        "indent",
+        "sep",  # separator outranks indentation, as in the old cascade
+        "other",
+    ]
+
+
+def test_txt_skip_existence_check_trusts_caller(fixture_dir, tmp_output_dir, capsys):
+    src = fixture_dir / "ligatures_and_softhyphens.txt"
+    out = tmp_output_dir / "ligatures_and_softhyphens.md"
+    out.write_text("stale", encoding="utf-8")
+    assert convert_txt(src, tmp_output_dir, options=PipelineOptions())
+    assert "SKIP (exists)" in capsys.readouterr().out
+    assert out.read_text(encoding="utf-8") == "stale"
+
+    assert convert_txt(
+        src, tmp_output_dir, options=PipelineOptions(), skip_existence_check=True
+    )
+    assert out.read_text(encoding="utf-8").startswith("---\n")
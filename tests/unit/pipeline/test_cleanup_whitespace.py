@@ -36,3 +36,34 @@ def test_preserves_indentation_inside_code_blocks():
     text = "    indented line"
     # Leading runs are NOT collapsed — only inter-word runs.
     assert collapse_whitespace(text, PipelineOptions()) == "    indented line"
+
+
+def test_whitespace_only_lines_count_toward_blank_run():
+    text = "alpha  \n \t\n\n  \nbeta"
+    assert collapse_whitespace(text, PipelineOptions()) == "alpha\n\nbeta"
+
+
+def test_links_kept_without_strip_links():
+    text = "see [the docs](https://example.com) here"
+    assert collapse_whitespace(text, PipelineOptions()) == text
+
+
+def test_strip_links_replaces_link_with_text():
+    text = "see [the  docs](https://example.com)  here"
+    out = collapse_whitespace(text, PipelineOptions(strip_links=True))
+    assert out == "see the docs here"
+
+
+def test_strip_links_leaves_images_alone():
+    text = "![chart](fig1.png) and [ref](https://example.com)"
+    out = collapse_whitespace(text, PipelineOptions(strip_links=True))
+    assert out == "![chart](fig1.png) and ref"
+
+
+def test_clean_text_is_returned_unchanged():
+    text = "# Title\n\nalpha beta\ngamma\n\ndelta"
+    assert collapse_whitespace(text, PipelineOptions()) is text
+
+
+def test_trailing_space_at_end_of_text_is_stripped():
+    assert collapse_whitespace("alpha beta ", PipelineOptions()) == "alpha beta"
@@ -43,3 +43,15 @@ def test_conservative_profile_keeps_byline():
     out = strip_repeated_byline(text, PipelineOptions(profile="conservative"))
     assert "Author's Contact Information" in out
     assert "Contact: alice@example.com" in out
+
+
+def test_uppercase_contact_line_dropped():
+    text = "# Title\n\nCONTACT: alice@example.com\n\nBody.\n"
+    out = strip_repeated_byline(text, PipelineOptions(profile="aggressive"))
+    assert "alice@example.com" not in out
+
+
+def test_text_without_contact_is_returned_unchanged():
+    text = "# Title\n\nBody.\n"
+    out = strip_repeated_byline(text, PipelineOptions(profile="aggressive"))
+    assert out is text
@@ -50,3 +50,29 @@ def test_creates_parent_dir_if_missing(tmp_path):
     out = tmp_path / "deep" / "nested" / "x.md"
     atomic_write_text(out, "hi")
     assert out.read_text(encoding="utf-8") == "hi"
+
+
+def test_writes_chunks_in_order_without_newline_translation(tmp_path):
+    out = tmp_path / "x.md"
+    atomic_write_text(out, "---\ntitle: é\n---\n\n", "body\r\nline\n")
+    assert out.read_bytes() == "---\ntitle: é\n---\n\nbody\r\nline\n".encode()
+
+
+@pytest.mark.parametrize("gather", [True, False])
+def test_short_writes_are_resumed(tmp_path, monkeypatch, gather):
+    real_write = os.write
+
+    def short_write(fd, data):
+        return real_write(fd, bytes(data[:3]))
+
+    def short_writev(fd, buffers):
+        return short_write(fd, b"".join(buffers))
+
+    if gather:
+        monkeypatch.setattr("any2md.utils.os.writev", short_writev)
+    else:
+        monkeypatch.delattr("any2md.utils.os.writev", raising=False)
+        monkeypatch.setattr("any2md.utils.os.write", short_write)
+    out = tmp_path / "x.md"
+    atomic_write_text(out, "---\nhead\n---\n", "", "body text\n")
+    assert out.read_text(encoding="utf-8") == "---\nhead\n---\nbody text\n"
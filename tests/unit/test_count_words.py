@@ -0,0 +1,24 @@
+"""Tests for count_words (frontmatter word_count)."""
+
+from __future__ import annotations
+
+import pytest
+
+from any2md.utils import count_words
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "   ",
+        "one",
+        "  two words  ",
+        "line one\nline two\n",
+        "a\r\nb\rc\x0bd\x0ce\x1cf\x85g h",
+        "tab\tand\xa0nbsp",
+        "\n\n# Heading\n\nBody text here.\n",
+    ],
+)
+def test_count_words_matches_str_split(text):
+    assert count_words(text) == len(text.split())
@@ -2,7 +2,7 @@
 
 import yaml
 
-from any2md.frontmatter import SourceMeta, compose
+from any2md.frontmatter import SourceMeta, compose, compose_parts
 from any2md.pipeline import PipelineOptions
 
 
@@ -159,6 +159,16 @@ def test_compose_deterministic_for_same_input():
     assert a == b
 
 
+def test_compose_parts_joins_to_compose():
+    body = "# Title\r\n\nbody without trailing newline"
+    header, body_out = compose_parts(body, _meta(date="2026-04-26"), PipelineOptions())
+    assert header.startswith("---\n") and header.endswith("---\n\n")
+    assert body_out == "# Title\n\nbody without trailing newline\n"
+    assert header + body_out == compose(
+        body, _meta(date="2026-04-26"), PipelineOptions()
+    )
+
+
 def test_compose_emits_produced_by_when_set():
     out = compose(
         "# T\n\nbody\n",
@@ -132,6 +132,19 @@ def test_derive_title_falls_back_to_filename_when_neither():
     assert derive_title(body, title_hint=None, fallback="my_doc.pdf") == "my doc"
 
 
+def test_derive_title_finds_h1_past_the_search_window():
+    body = "intro line\n" * 1000 + "# Late Title\n\nbody\n"
+    assert derive_title(body, title_hint=None, fallback="x.pdf") == "Late Title"
+
+
+def test_derive_title_h1_straddling_search_window_is_not_truncated():
+    body = "x" * 4080 + "\n# A Title Longer Than The Window Edge\n"
+    assert (
+        derive_title(body, title_hint=None, fallback="x.pdf")
+        == "A Title Longer Than The Window Edge"
+    )
+
+
 def test_derive_title_strips_markdown_emphasis_in_h1():
     body = "# **Bold Title** _emphasis_\n"
     assert derive_title(body, title_hint=None, fallback="x") == "Bold Title emphasis"
@@ -0,0 +1,50 @@
+"""Tests for the HTML converter's boilerplate preclean (fallback path)."""
+
+from __future__ import annotations
+
+import lxml.html
+
+from any2md.converters.html import _preclean_tree
+
+
+def _preclean(html) -> str:
+    tree = _preclean_tree(html)
+    assert tree is not None
+    return lxml.html.tostring(tree, encoding="unicode")
+
+
+def test_strips_boilerplate_elements():
+    html = (
+        "<html><head><style>p{}</style></head><body>"
+        "<header>Site header</header><nav>Menu</nav>"
+        "<p>Body text</p><aside>Sidebar</aside>"
+        "<iframe src='x'></iframe><footer>Site footer</footer>"
+        "</body></html>"
+    )
+    out = _preclean(html)
+    assert "Body text" in out
+    for noise in ("Site header", "Menu", "Sidebar", "Site footer", "p{}", "iframe"):
+        assert noise not in out
+
+
+def test_keeps_text_after_removed_element():
+    out = _preclean("<p>before<script>evil()</script>after</p>")
+    assert "evil" not in out
+    assert "beforeafter" in out
+
+
+def test_accepts_xml_encoding_declaration():
+    out = _preclean('<?xml version="1.0" encoding="utf-8"?><p>café</p>')
+    assert "café" in out
+
+
+def test_empty_or_unparseable_input_returns_none():
+    assert _preclean_tree("") is None
+    assert _preclean_tree("<!-- only a comment -->") is None
+
+
+def test_preparsed_tree_is_copied_not_mutated():
+    tree = lxml.html.document_fromstring("<p>Body</p><nav>Menu</nav>")
+    out = _preclean(tree)
+    assert "Menu" not in out
+    assert "Menu" in lxml.html.tostring(tree, encoding="unicode")
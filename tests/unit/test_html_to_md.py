@@ -0,0 +1,61 @@
+"""Tests for the lxml HTML-to-Markdown walker."""
+
+from __future__ import annotations
+
+import lxml.html
+import pytest
+
+from any2md.converters._html_to_md import html_to_markdown
+
+
+@pytest.mark.parametrize(
+    "html,expected",
+    [
+        ("", ""),
+        ("   ", ""),
+        ("<h2>Title</h2><p>Body</p>", "## Title\n\nBody\n"),
+        ("<p>a <strong>bold </strong>word</p>", "a **bold** word\n"),
+        ("<p><em>x</em> and <b>y</b></p>", "*x* and **y**\n"),
+        ("<p>snake_case *star*</p>", "snake\\_case \\*star\\*\n"),
+        ('<p><a href="https://e.x/">site</a></p>', "[site](https://e.x/)\n"),
+        ('<p><a id="bookmark">anchor</a></p>', "anchor\n"),
+        ("<p>line<br>break</p>", "line  \nbreak\n"),
+        ("<ul><li>one</li><li>two</li></ul>", "- one\n- two\n"),
+        ('<ol start="3"><li>c</li><li>d</li></ol>', "3. c\n4. d\n"),
+        ("<ul><li>a<ul><li>b</li></ul></li></ul>", "- a\n  - b\n"),
+        ("<pre><code>x = 1\n  y</code></pre>", "```\nx = 1\n  y\n```\n"),
+        ("<p>use <code>a_b</code></p>", "use `a_b`\n"),
+        ("<blockquote><p>q</p></blockquote>", "> q\n"),
+        ("<p>a</p>\n  <p>b</p>", "a\n\nb\n"),
+        ("<p>x<!-- note -->y</p>", "xy\n"),
+        ("<div><script>evil()</script><p>ok</p></div>", "ok\n"),
+    ],
+)
+def test_html_to_markdown(html, expected):
+    assert html_to_markdown(html) == expected
+
+
+def test_table_first_row_is_header():
+    html = (
+        "<table><tr><td><p>H1</p></td><td><p>H2</p></td></tr>"
+        "<tr><td>a|b</td><td>c<br>d</td></tr></table>"
+    )
+    assert html_to_markdown(html) == "| H1 | H2 |\n| --- | --- |\n| a\\|b | c d |\n"
+
+
+def test_ragged_table_rows_are_padded():
+    html = "<table><thead><tr><th>A</th><th>B</th></tr></thead><tbody><tr><td>1</td></tr></tbody></table>"
+    assert html_to_markdown(html) == "| A | B |\n| --- | --- |\n| 1 |  |\n"
+
+
+def test_images_stripped_by_default():
+    html = '<p>see <img src="a.png" alt="fig"> here</p>'
+    assert html_to_markdown(html) == "see  here\n"
+    assert html_to_markdown(html, strip_images=False) == "see ![fig](a.png) here\n"
+
+
+def test_accepts_parsed_document_and_skips_head():
+    tree = lxml.html.document_fromstring(
+        "<html><head><title>T</title></head><body><h1>Doc</h1><p>text</p></body></html>"
+    )
+    assert html_to_markdown(tree) == "# Doc\n\ntext\n"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import http.client
 import io
 import socket
 import urllib.error
@@ -14,6 +15,7 @@ from any2md._http import (
     _MAX_REDIRECT_HOPS,
     _MAX_RESPONSE_BYTES,
     safe_fetch,
+    safe_stream,
     validate_url,
 )
 
@@ -87,10 +89,17 @@ class _FakeHTTPResponse:
         for k, v in (headers or {}).items():
             msg[k] = v
         self.headers = msg
+        self.closed = False
 
     def read(self, n: int | None = None) -> bytes:
         return self._buf.read(n) if n is not None else self._buf.read()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.closed = True
+
 
 def _http_error(code: int, location: str | None = None) -> urllib.error.HTTPError:
     msg = Message()
@@ -200,3 +209,100 @@ def test_safe_fetch_http_error_other(monkeypatch):
     _patch_opener(monkeypatch, opener)
     _b, _h, err = safe_fetch("https://err.example/")
     assert err and "500" in err
+
+
+def test_safe_stream_delivers_chunks(monkeypatch):
+    _stub_dns(monkeypatch, {"public.example": "1.1.1.1"})
+    opener = _FakeOpener([_FakeHTTPResponse(b"abcdefghij", {"X-Test": "1"})])
+    _patch_opener(monkeypatch, opener)
+    chunks: list[bytes] = []
+    headers, err = safe_stream("https://public.example/", chunks.append, chunk_size=4)
+    assert err is None
+    assert chunks == [b"abcd", b"efgh", b"ij"]
+    assert headers and headers.get("X-Test") == "1"
+
+
+def test_safe_stream_response_size_cap(monkeypatch):
+    _stub_dns(monkeypatch, {"big.example": "1.1.1.1"})
+    huge = b"x" * (_MAX_RESPONSE_BYTES + 100)
+    opener = _FakeOpener([_FakeHTTPResponse(huge)])
+    _patch_opener(monkeypatch, opener)
+    seen = 0
+
+    def count(chunk: bytes) -> None:
+        nonlocal seen
+        seen += len(chunk)
+
+    _h, err = safe_stream("https://big.example/", count)
+    assert err and "exceeds" in err
+    assert seen <= _MAX_RESPONSE_BYTES
+
+
+def test_safe_stream_rejects_redirect_to_private(monkeypatch):
+    _stub_dns(
+        monkeypatch,
+        {"public.example": "1.1.1.1", "rebound.example": "169.254.169.254"},
+    )
+    opener = _FakeOpener([_http_error(302, "http://rebound.example/")])
+    _patch_opener(monkeypatch, opener)
+    chunks: list[bytes] = []
+    _h, err = safe_stream("https://public.example/", chunks.append)
+    assert err and "disallowed" in err
+    assert chunks == []
+
+
+def test_validate_url_resolves_each_host_once(monkeypatch):
+    calls: list[str] = []
+
+    def fake(host, *_a, **_kw):
+        calls.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("1.1.1.1", 0))]
+
+    monkeypatch.setattr("any2md._http.socket.getaddrinfo", fake)
+    assert validate_url("https://docs.example/a") is None
+    assert validate_url("https://docs.example/b") is None
+    assert validate_url("http://other.example/") is None
+    assert calls == ["docs.example", "other.example"]
+
+
+def test_validate_url_rechecks_host_after_failure(monkeypatch):
+    calls: list[str] = []
+
+    def flaky(host, *_a, **_kw):
+        calls.append(host)
+        if len(calls) == 1:
+            raise socket.gaierror("temporary failure in name resolution")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("1.1.1.1", 0))]
+
+    monkeypatch.setattr("any2md._http.socket.getaddrinfo", flaky)
+    err = validate_url("https://docs.example/a")
+    assert err and "resolve" in err
+    assert validate_url("https://docs.example/a") is None
+    assert validate_url("https://docs.example/b") is None
+    assert calls == ["docs.example", "docs.example"]
+
+
+class _TruncatedHTTPResponse(_FakeHTTPResponse):
+    def read(self, n: int | None = None) -> bytes:
+        raise http.client.IncompleteRead(b"partial", 100)
+
+
+def test_safe_stream_closes_response(monkeypatch):
+    _stub_dns(monkeypatch, {"public.example": "1.1.1.1"})
+    resp = _FakeHTTPResponse(b"abcdefghij")
+    _patch_opener(monkeypatch, _FakeOpener([resp]))
+    _h, err = safe_stream("https://public.example/", lambda _chunk: None)
+    assert err is None
+    assert resp.closed
+
+
+def test_truncated_body_is_a_fetch_error(monkeypatch):
+    _stub_dns(monkeypatch, {"public.example": "1.1.1.1"})
+    _patch_opener(
+        monkeypatch,
+        _FakeOpener([_TruncatedHTTPResponse(b""), _TruncatedHTTPResponse(b"")]),
+    )
+    _h, err = safe_stream("https://public.example/", lambda _chunk: None)
+    assert err and "fetch error" in err
+    _b, _h, err = safe_fetch("https://public.example/")
+    assert err and "fetch error" in err
@@ -0,0 +1,36 @@
+"""Tests for sanitize_filename / url_to_filename (output .md names)."""
+
+from __future__ import annotations
+
+import pytest
+
+from any2md.utils import sanitize_filename, url_to_filename
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("report.pdf", "report.md"),
+        ("My Report; draft: v2 — final.pdf", "My_Report_draft_v2_final.md"),
+        ('it\'s "quoted", ok–done.docx', "its_quoted_okdone.md"),
+        ("tab\there\x00\x7f.txt", "tabhere.md"),
+        ("back\\slash.txt", "backslash.md"),
+        ("sub/dir/name.txt", "name.md"),
+        ("  __spaced__  .html", "spaced.md"),
+        (";;;.pdf", "untitled.md"),
+    ],
+)
+def test_sanitize_filename(name, expected):
+    assert sanitize_filename(name) == expected
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://example.com/blog/my-post", "example_com_blog_my-post.md"),
+        ("https://example.com/", "example_com.md"),
+        ("http://a.b.c//x..y/", "a_b_c_x_y.md"),
+    ],
+)
+def test_url_to_filename(url, expected):
+    assert url_to_filename(url) == expected
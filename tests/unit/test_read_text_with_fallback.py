@@ -0,0 +1,42 @@
+"""Tests for read_text_with_fallback (TXT/HTML input decoding)."""
+
+from __future__ import annotations
+
+import pytest
+
+from any2md import utils
+from any2md.utils import read_text_with_fallback
+
+
+@pytest.fixture(params=["read", "mmap"])
+def size_branch(request, monkeypatch):
+    # Force each size branch regardless of the test file's size.
+    threshold = 1 << 40 if request.param == "read" else 0
+    monkeypatch.setattr(utils, "_MMAP_MIN_BYTES", threshold)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"plain ascii\n",
+        "café utf-8\n".encode(),
+        "café latin-1\n".encode("latin-1"),
+        b"crlf\r\nlines\r\n",
+        b"old mac\rline\r",
+        b"mixed\r\n\r\rend",
+    ],
+)
+def test_matches_text_mode_read(tmp_path, size_branch, data):
+    path = tmp_path / "in.txt"
+    path.write_bytes(data)
+    try:
+        expected = path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        expected = path.read_text(encoding="latin-1")
+    assert read_text_with_fallback(path) == expected
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert read_text_with_fallback(path) == ""